@@ -0,0 +1,111 @@
+"""Initial schema.
+
+Databases created before migrations were introduced (via
+``Base.metadata.create_all``) already have these tables, so each table is
+only created when missing.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table("facilities"):
+        op.create_table(
+            "facilities",
+            sa.Column("facility_id", sa.String(), primary_key=True),
+            sa.Column("name", sa.Text(), nullable=False),
+            sa.Column("address", sa.Text()),
+            sa.Column("postal_code", sa.String(10)),
+            sa.Column("district", sa.String(100)),
+            sa.Column("latitude", sa.Double()),
+            sa.Column("longitude", sa.Double()),
+            sa.Column("is_indoor", sa.Boolean()),
+            sa.Column("phone", sa.String(20)),
+            sa.Column("website", sa.Text()),
+            sa.Column("source", sa.String(50)),
+            sa.Column("raw", postgresql.JSONB()),
+            sa.Column("created_at", sa.DateTime()),
+            sa.Column("updated_at", sa.DateTime()),
+        )
+
+    if not inspector.has_table("sessions"):
+        op.create_table(
+            "sessions",
+            sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+            sa.Column(
+                "facility_id",
+                sa.String(),
+                sa.ForeignKey("facilities.facility_id"),
+                nullable=False,
+            ),
+            sa.Column("swim_type", sa.String(50), nullable=False),
+            sa.Column("date", sa.Date(), nullable=False),
+            sa.Column("start_time", sa.Time(), nullable=False),
+            sa.Column("end_time", sa.Time(), nullable=False),
+            sa.Column("notes", sa.Text()),
+            sa.Column("source", sa.String(50)),
+            sa.Column("hash", sa.String(64), unique=True),
+            sa.Column("created_at", sa.DateTime()),
+            sa.Column("updated_at", sa.DateTime()),
+            sa.UniqueConstraint(
+                "facility_id", "date", "start_time", "swim_type", name="uq_session"
+            ),
+        )
+
+    if not inspector.has_table("users"):
+        op.create_table(
+            "users",
+            sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+            sa.Column("email", sa.String(255), nullable=False),
+            sa.Column("name", sa.String(255)),
+            sa.Column("google_id", sa.String(255), nullable=False),
+            sa.Column("picture", sa.Text()),
+            sa.Column("created_at", sa.DateTime()),
+            sa.Column("updated_at", sa.DateTime()),
+        )
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+        op.create_index("ix_users_google_id", "users", ["google_id"], unique=True)
+
+    if not inspector.has_table("user_favorites"):
+        op.create_table(
+            "user_favorites",
+            sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+            sa.Column(
+                "user_id", sa.BigInteger(), sa.ForeignKey("users.id"), nullable=False
+            ),
+            sa.Column(
+                "facility_id",
+                sa.String(),
+                sa.ForeignKey("facilities.facility_id"),
+                nullable=False,
+            ),
+            sa.Column("created_at", sa.DateTime()),
+            sa.UniqueConstraint("user_id", "facility_id", name="uq_user_favorite"),
+        )
+        op.create_index("ix_user_favorites_user_id", "user_favorites", ["user_id"])
+        op.create_index(
+            "ix_user_favorites_facility_id", "user_favorites", ["facility_id"]
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("user_favorites")
+    op.drop_table("users")
+    op.drop_table("sessions")
+    op.drop_table("facilities")
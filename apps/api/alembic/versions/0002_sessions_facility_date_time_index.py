@@ -0,0 +1,30 @@
+"""Add covering index for next-session lookups.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 09:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_sessions_facility_date_time",
+        "sessions",
+        ["facility_id", "date", "start_time"],
+        postgresql_include=["swim_type", "end_time", "notes"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sessions_facility_date_time", table_name="sessions")
@@ -0,0 +1,41 @@
+"""Store sessions.hash as a raw 32-byte SHA-256 digest.
+
+Existing values are 64-character hex strings, so they are decoded in
+place. The unique index on hash is rebuilt by Postgres as part of the
+type change.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 11:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "sessions",
+        "hash",
+        type_=sa.LargeBinary(32),
+        existing_type=sa.String(64),
+        postgresql_using="decode(hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "sessions",
+        "hash",
+        type_=sa.String(64),
+        existing_type=sa.LargeBinary(32),
+        postgresql_using="encode(hash, 'hex')",
+    )
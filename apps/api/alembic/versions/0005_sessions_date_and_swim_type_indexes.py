@@ -0,0 +1,39 @@
+"""Add indexes for date and swim type session filters.
+
+(facility_id, date) lookups are already served by the leading columns
+of ix_sessions_facility_date_time.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_sessions_date_start",
+        "sessions",
+        ["date", "start_time"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_sessions_swimtype_date",
+        "sessions",
+        ["swim_type", "date"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sessions_swimtype_date", table_name="sessions")
+    op.drop_index("ix_sessions_date_start", table_name="sessions")
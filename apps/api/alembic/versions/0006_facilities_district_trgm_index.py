@@ -0,0 +1,37 @@
+"""Add a trigram index for district ILIKE filters.
+
+The facilities and schedule endpoints filter with
+district ILIKE '%...%', which a b-tree index can't serve. This index
+lives only in migrations: the model doesn't declare it, because
+create_all would fail on databases without pg_trgm.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15 13:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_facilities_district_trgm",
+        "facilities",
+        ["district"],
+        postgresql_using="gin",
+        postgresql_ops={"district": "gin_trgm_ops"},
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_facilities_district_trgm", table_name="facilities")
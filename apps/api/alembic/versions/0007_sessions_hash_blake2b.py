@@ -0,0 +1,79 @@
+"""Rehash sessions.hash as a 16-byte BLAKE2b digest.
+
+The ingestion jobs now hash "facility_id:date:start_time:swim_type" with
+BLAKE2b-128 instead of SHA-256. Postgres has no BLAKE2b function, so
+existing rows are rehashed in Python from the same columns.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15 14:00:00
+
+"""
+import hashlib
+from typing import Callable, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+sessions = sa.table(
+    "sessions",
+    sa.column("id", sa.BigInteger),
+    sa.column("facility_id", sa.String),
+    sa.column("date", sa.Date),
+    sa.column("start_time", sa.Time),
+    sa.column("swim_type", sa.String),
+    sa.column("hash", sa.LargeBinary),
+)
+
+
+def _blake2b(content: bytes) -> bytes:
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _sha256(content: bytes) -> bytes:
+    return hashlib.sha256(content).digest()
+
+
+def _rehash(digest: Callable[[bytes], bytes]) -> None:
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(
+            sessions.c.id,
+            sessions.c.facility_id,
+            sessions.c.date,
+            sessions.c.start_time,
+            sessions.c.swim_type,
+        )
+    ).all()
+
+    update = (
+        sessions.update()
+        .where(sessions.c.id == sa.bindparam("row_id"))
+        .values(hash=sa.bindparam("new_hash"))
+    )
+    for start in range(0, len(rows), BATCH_SIZE):
+        bind.execute(update, [
+            {
+                "row_id": row.id,
+                "new_hash": digest(
+                    f"{row.facility_id}:{row.date}:{row.start_time}:{row.swim_type}".encode()
+                ),
+            }
+            for row in rows[start:start + BATCH_SIZE]
+        ])
+
+
+def upgrade() -> None:
+    _rehash(_blake2b)
+
+
+def downgrade() -> None:
+    _rehash(_sha256)
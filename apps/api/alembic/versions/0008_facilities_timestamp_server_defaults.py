@@ -0,0 +1,37 @@
+"""Default facility timestamps to now() on the server.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15 16:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for column in ("created_at", "updated_at"):
+        op.alter_column(
+            "facilities",
+            column,
+            server_default=sa.func.now(),
+            existing_type=sa.DateTime(timezone=True),
+        )
+
+
+def downgrade() -> None:
+    for column in ("created_at", "updated_at"):
+        op.alter_column(
+            "facilities",
+            column,
+            server_default=None,
+            existing_type=sa.DateTime(timezone=True),
+        )
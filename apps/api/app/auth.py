@@ -1,10 +1,18 @@
 """Authentication utilities."""
-from datetime import datetime, timedelta
+import base64
+import hashlib
+import hmac
+import threading
+import time
+from datetime import timedelta
 from typing import Optional
+import orjson
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
+from loguru import logger
 
 from app.config import settings
 from app.database import get_db
@@ -12,67 +20,97 @@ from app.models import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login", auto_error=False)
 
+# Verified payloads keyed by raw token, so repeat requests from a signed-in
+# user skip the HMAC check. Entries never outlive the token's own expiry.
+_payload_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+# get_current_user runs in the threadpool and TTLCache isn't thread-safe
+_payload_cache_lock = threading.Lock()
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as JWT requires."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# The HS256 header never changes, so encode it once
+_HS256_HEADER = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+_SECRET_KEY = settings.secret_key.encode()
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
-    """Create JWT access token."""
+    """Create JWT access token.
+    
+    ``sub`` is always encoded as the string form of the user id: the JWT spec
+    (and python-jose) require a string subject.
+    """
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
-    return encoded_jwt
+    if "sub" in to_encode:
+        to_encode["sub"] = str(int(to_encode["sub"]))
+    if not expires_delta:
+        expires_delta = timedelta(minutes=settings.access_token_expire_minutes)
+    # JWT wants an integer epoch for exp; skip building a naive datetime
+    to_encode.update({"exp": int(time.time() + expires_delta.total_seconds())})
+    
+    if settings.algorithm != "HS256":
+        return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    
+    # Sign inline: only the payload segment and HMAC vary per token
+    signing_input = _HS256_HEADER + b"." + _b64url(orjson.dumps(to_encode))
+    signature = _b64url(hmac.new(_SECRET_KEY, signing_input, hashlib.sha256).digest())
+    return (signing_input + b"." + signature).decode()
 
 
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode and verify JWT token."""
-    from loguru import logger
+    with _payload_cache_lock:
+        payload = _payload_cache.get(token)
+        if payload is not None:
+            if payload.get("exp", 0) > time.time():
+                return payload
+            _payload_cache.pop(token, None)
+    
+    # Verify outside the lock so one slow decode doesn't serialize requests
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        with _payload_cache_lock:
+            _payload_cache[token] = payload
         return payload
     except JWTError as e:
-        logger.error(f"JWT decode error: {type(e).__name__}: {str(e)}")
+        # Expired or tampered tokens are routine; don't log them at ERROR
+        logger.debug("JWT decode error: {}: {}", type(e).__name__, e)
         return None
     except Exception as e:
         logger.error(f"Unexpected error decoding token: {type(e).__name__}: {str(e)}")
         return None
 
 
-async def get_current_user(
+def get_current_user(
     token: Optional[str] = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ) -> Optional[User]:
     """Get current user from token."""
-    from loguru import logger
-    
+    # Runs on every authenticated request: keep logging at DEBUG and lazy so
+    # nothing is formatted unless DEBUG is enabled
     if not token:
-        logger.info("❌ No token provided in request")
+        logger.debug("No token provided in request")
         return None
     
-    logger.info(f"✓ Token received: {token[:30]}...")
+    logger.opt(lazy=True).debug("Token received: {}...", lambda: token[:30])
     payload = decode_access_token(token)
     if not payload:
-        logger.error(f"❌ Failed to decode token: {token[:30]}...")
+        logger.opt(lazy=True).debug("Failed to decode token: {}...", lambda: token[:30])
         return None
     
-    logger.info(f"✓ Token payload decoded: {payload}")
+    # create_access_token always encodes sub as a decimal string
     user_id_str = payload.get("sub")
-    if user_id_str is None:
-        logger.error("❌ No user_id (sub) in token payload")
-        return None
-    
-    try:
-        user_id = int(user_id_str)
-    except (ValueError, TypeError):
-        logger.error(f"❌ Invalid user_id in token: {user_id_str}")
+    if not isinstance(user_id_str, str) or not user_id_str.isdigit():
+        logger.debug("Invalid user_id (sub) in token payload: {}", user_id_str)
         return None
     
-    user = db.query(User).filter(User.id == user_id).first()
-    if user:
-        logger.info(f"✓ User authenticated: {user.email}")
-    else:
-        logger.error(f"❌ No user found with id: {user_id}")
+    user_id = int(user_id_str)
+    user = db.get(User, user_id)
+    if not user:
+        logger.debug("No user found with id: {}", user_id)
     return user
 
 
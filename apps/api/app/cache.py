@@ -1,12 +1,31 @@
 """Redis cache utilities."""
-import json
+import asyncio
 import hashlib
-from typing import Optional, Any, Callable
+import socket
+from contextlib import asynccontextmanager
+from typing import Optional, Any, AsyncIterator, Callable, Dict, List
 from functools import wraps
+import orjson
 import redis.asyncio as aioredis
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from starlette.concurrency import run_in_threadpool
+from redis.asyncio.client import Pipeline
 from loguru import logger
 
 from app.config import settings
+from app.dates import get_today_toronto
+
+# Number of keys fetched per SCAN and unlinked per pipeline
+SCAN_BATCH_SIZE = 500
+
+# Probe idle connections so load balancers/NAT don't silently drop them.
+# Only set the options this platform supports (TCP_KEEPIDLE is Linux-only).
+KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
 
 
 class CacheManager:
@@ -24,10 +43,14 @@ class CacheManager:
             return
         
         try:
+            # Values are stored as orjson bytes, so skip decoding to str on reads
             self.redis_client = await aioredis.from_url(
                 settings.redis_url,
-                encoding="utf-8",
-                decode_responses=True
+                decode_responses=False,
+                max_connections=settings.redis_max_connections,
+                socket_keepalive=True,
+                socket_keepalive_options=KEEPALIVE_OPTIONS,
+                health_check_interval=30
             )
             await self.redis_client.ping()
             logger.info("Connected to Redis successfully")
@@ -43,10 +66,10 @@ class CacheManager:
     
     def _generate_cache_key(self, prefix: str, **kwargs) -> str:
         """Generate a cache key from prefix and parameters."""
-        # Sort kwargs for consistent key generation
-        sorted_params = sorted(kwargs.items())
-        param_str = json.dumps(sorted_params, sort_keys=True, default=str)
-        param_hash = hashlib.md5(param_str.encode()).hexdigest()
+        # Sorting the items is enough for a canonical form; blake2b with a
+        # 128-bit digest is faster than MD5 in CPython
+        param_str = repr(sorted(kwargs.items()))
+        param_hash = hashlib.blake2b(param_str.encode(), digest_size=16).hexdigest()
         return f"{prefix}:{param_hash}"
     
     async def get(self, key: str) -> Optional[Any]:
@@ -58,7 +81,23 @@ class CacheManager:
             value = await self.redis_client.get(key)
             if value:
                 logger.debug(f"Cache HIT: {key}")
-                return json.loads(value)
+                return orjson.loads(value)
+            logger.debug(f"Cache MISS: {key}")
+            return None
+        except Exception as e:
+            logger.error(f"Cache get error: {e}")
+            return None
+    
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        """Get the stored bytes for a key without deserializing them."""
+        if not self.enabled or not self.redis_client:
+            return None
+        
+        try:
+            value = await self.redis_client.get(key)
+            if value:
+                logger.debug(f"Cache HIT: {key}")
+                return value
             logger.debug(f"Cache MISS: {key}")
             return None
         except Exception as e:
@@ -67,19 +106,85 @@ class CacheManager:
     
     async def set(self, key: str, value: Any, ttl: int = None) -> bool:
         """Set value in cache with optional TTL."""
+        return await self.set_raw(key, orjson.dumps(value, default=str), ttl=ttl)
+    
+    async def set_raw(self, key: str, payload: bytes, ttl: Optional[int] = None) -> bool:
+        """Store already-serialized bytes with optional TTL."""
         if not self.enabled or not self.redis_client:
             return False
         
         try:
             ttl = ttl or settings.cache_ttl
-            serialized = json.dumps(value, default=str)
-            await self.redis_client.setex(key, ttl, serialized)
+            await self.redis_client.setex(key, ttl, payload)
             logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
             return True
         except Exception as e:
             logger.error(f"Cache set error: {e}")
             return False
     
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values in one round-trip (None for misses)."""
+        if not keys:
+            return []
+        if not self.enabled or not self.redis_client:
+            return [None] * len(keys)
+        
+        try:
+            values = await self.redis_client.mget(*keys)
+            logger.debug(f"Cache MGET: {len(keys)} keys")
+            return [orjson.loads(value) if value else None for value in values]
+        except Exception as e:
+            logger.error(f"Cache mget error: {e}")
+            return [None] * len(keys)
+    
+    async def mset_with_ttl(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set several values with a shared TTL in one pipelined round-trip."""
+        if not items:
+            return True
+        if not self.enabled or not self.redis_client:
+            return False
+        
+        try:
+            ttl = ttl or settings.cache_ttl
+            async with self.pipeline() as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, ttl, orjson.dumps(value, default=str))
+                await pipe.execute()
+            logger.debug(f"Cache MSET: {len(items)} keys (TTL: {ttl}s)")
+            return True
+        except Exception as e:
+            logger.error(f"Cache mset error: {e}")
+            return False
+    
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncIterator[Pipeline]:
+        """Yield a non-transactional Redis pipeline.
+        
+        Callers must check that caching is enabled first.
+        """
+        if not self.enabled or not self.redis_client:
+            raise RuntimeError("Redis pipeline requested while caching is disabled")
+        
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            yield pipe
+    
+    async def add(self, key: str, value: Any, ttl: Optional[int] = None) -> Optional[bool]:
+        """Set value only if key is absent (SET NX).
+
+        Returns False when the key already exists and None when Redis is
+        unavailable, so callers can fall back to process-local state.
+        """
+        if not self.enabled or not self.redis_client:
+            return None
+        
+        try:
+            ttl = ttl or settings.cache_ttl
+            added = await self.redis_client.set(key, orjson.dumps(value, default=str), ex=ttl, nx=True)
+            return bool(added)
+        except Exception as e:
+            logger.error(f"Cache add error: {e}")
+            return None
+    
     async def delete(self, key: str) -> bool:
         """Delete key from cache."""
         if not self.enabled or not self.redis_client:
@@ -93,21 +198,39 @@ class CacheManager:
             logger.error(f"Cache delete error: {e}")
             return False
     
+    async def _unlink_batch(self, keys: List[str]) -> int:
+        """Unlink a batch of keys in a single pipelined round-trip."""
+        async with self.pipeline() as pipe:
+            for key in keys:
+                pipe.unlink(key)
+            results = await pipe.execute()
+        return sum(results)
+    
     async def delete_pattern(self, pattern: str) -> int:
-        """Delete all keys matching a pattern."""
+        """Delete all keys matching a pattern.
+        
+        Keys are collected in SCAN-sized batches and removed with pipelined
+        UNLINK calls, so memory stays bounded and Redis frees values in the
+        background instead of blocking on one large DEL.
+        """
         if not self.enabled or not self.redis_client:
             return 0
         
         try:
-            keys = []
-            async for key in self.redis_client.scan_iter(match=pattern):
-                keys.append(key)
+            deleted = 0
+            batch = []
+            async for key in self.redis_client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    deleted += await self._unlink_batch(batch)
+                    batch.clear()
             
-            if keys:
-                deleted = await self.redis_client.delete(*keys)
+            if batch:
+                deleted += await self._unlink_batch(batch)
+            
+            if deleted:
                 logger.info(f"Cache INVALIDATE: {pattern} ({deleted} keys)")
-                return deleted
-            return 0
+            return deleted
         except Exception as e:
             logger.error(f"Cache delete pattern error: {e}")
             return 0
@@ -130,8 +253,14 @@ class CacheManager:
 cache_manager = CacheManager()
 
 
-def cache_response(prefix: str, ttl: int = None):
-    """Decorator to cache endpoint responses."""
+def cache_response(prefix: str, ttl: int = None, per_day: bool = False):
+    """Decorator to cache endpoint responses.
+    
+    The JSON body is cached as bytes and served as-is on a hit, so cached
+    responses skip both deserialization and FastAPI's re-serialization.
+    Set per_day for endpoints whose result depends on today's date.
+    Sync endpoints are run in the threadpool, as FastAPI would run them.
+    """
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -140,21 +269,27 @@ def cache_response(prefix: str, ttl: int = None):
                 k: v for k, v in kwargs.items()
                 if k not in ['db', 'token'] and v is not None
             }
+            if per_day:
+                cache_kwargs['date'] = get_today_toronto().isoformat()
             
             cache_key = cache_manager._generate_cache_key(prefix, **cache_kwargs)
             
             # Try to get from cache
-            cached_value = await cache_manager.get(cache_key)
-            if cached_value is not None:
-                return cached_value
+            cached_payload = await cache_manager.get_raw(cache_key)
+            if cached_payload is not None:
+                return Response(content=cached_payload, media_type="application/json")
             
             # Call the actual function
-            result = await func(*args, **kwargs)
+            if asyncio.iscoroutinefunction(func):
+                result = await func(*args, **kwargs)
+            else:
+                result = await run_in_threadpool(func, *args, **kwargs)
             
-            # Cache the result
-            await cache_manager.set(cache_key, result, ttl=ttl)
+            # Cache the serialized result
+            payload = orjson.dumps(jsonable_encoder(result))
+            await cache_manager.set_raw(cache_key, payload, ttl=ttl)
             
-            return result
+            return Response(content=payload, media_type="application/json")
         
         return wrapper
     return decorator
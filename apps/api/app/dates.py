@@ -0,0 +1,17 @@
+"""Date helpers for Toronto-local schedules."""
+import time
+from datetime import date, datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+TORONTO_TZ = ZoneInfo("America/Toronto")
+
+
+@lru_cache(maxsize=1)
+def _today(minute: int) -> date:
+    return datetime.now(TORONTO_TZ).date()
+
+
+def get_today_toronto() -> date:
+    """Today's date in Toronto, recomputed at most once a minute."""
+    return _today(int(time.time()) // 60)
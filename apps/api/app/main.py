@@ -1,13 +1,13 @@
 """Main FastAPI application."""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from loguru import logger
+import httpx
 import sys
 
+from app.cache import cache_manager
 from app.config import settings
-from app.database import engine
-from app.models import Base
 from app.routes import facilities, schedule, update, health, auth, favorites
 
 # Configure logging
@@ -18,14 +18,14 @@ logger.add(
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>"
 )
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# Schema is managed only by Alembic (`make migrate`)
 
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
     version=settings.version,
     description="API for Toronto indoor pool drop-in swim schedules",
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
@@ -52,7 +52,7 @@ app.include_router(update.router, prefix="/update", tags=["update"])
 async def global_exception_handler(request, exc):
     """Global exception handler."""
     logger.exception(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
@@ -62,10 +62,19 @@ async def global_exception_handler(request, exc):
 async def startup_event():
     """Startup event."""
     logger.info(f"Starting {settings.app_name} v{settings.version}")
+    await cache_manager.connect()
+    # Shared outbound HTTP client (e.g. Google OAuth) so connections and TLS
+    # sessions are reused across requests
+    app.state.http_client = httpx.AsyncClient(
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=50)
+    )
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Shutdown event."""
     logger.info("Shutting down API")
+    await cache_manager.disconnect()
+    await app.state.http_client.aclose()
 
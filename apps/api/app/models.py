@@ -1,15 +1,26 @@
 """Database models."""
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy import (
     Column, String, Boolean, DateTime, Date, Time, 
-    BigInteger, Double, Text, ForeignKey, UniqueConstraint
+    BigInteger, Double, Integer, JSON, Text, ForeignKey, Index, LargeBinary,
+    UniqueConstraint, func
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 Base = declarative_base()
 
+# SQLite (used by the test suite) only autoincrements INTEGER primary keys
+# and has no JSONB; Postgres still gets BIGINT/JSONB
+BigIntegerPK = BigInteger().with_variant(Integer, "sqlite")
+JSONBType = JSONB().with_variant(JSON, "sqlite")
+
+
+def utcnow() -> datetime:
+    """Timezone-aware current UTC time for column defaults."""
+    return datetime.now(timezone.utc)
+
 
 class Facility(Base):
     """Community pool facility."""
@@ -27,9 +38,11 @@ class Facility(Base):
     phone = Column(String(20))
     website = Column(Text)
     source = Column(String(50))
-    raw = Column(JSONB)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Source payload isn't part of any API response; load only on access
+    raw = deferred(Column(JSONBType))
+    # Filled in by the database so bulk writes don't send timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     sessions = relationship("Session", back_populates="facility", cascade="all, delete-orphan")
@@ -43,7 +56,7 @@ class Session(Base):
     
     __tablename__ = "sessions"
     
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True)
     facility_id = Column(String, ForeignKey("facilities.facility_id"), nullable=False)
     swim_type = Column(String(50), nullable=False)
     date = Column(Date, nullable=False)
@@ -51,15 +64,24 @@ class Session(Base):
     end_time = Column(Time, nullable=False)
     notes = Column(Text)
     source = Column(String(50))
-    hash = Column(String(64), unique=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    hash = Column(LargeBinary(16), unique=True)  # BLAKE2b-128 digest
+    created_at = Column(DateTime(timezone=True), default=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
     
     # Relationships
     facility = relationship("Facility", back_populates="sessions")
     
     __table_args__ = (
         UniqueConstraint('facility_id', 'date', 'start_time', 'swim_type', name='uq_session'),
+        # Covers next-session lookups and per-facility counts without a heap fetch
+        Index(
+            'ix_sessions_facility_date_time', 'facility_id', 'date', 'start_time',
+            postgresql_include=['swim_type', 'end_time', 'notes']
+        ),
+        # Date-range schedule queries ordered by start time
+        Index('ix_sessions_date_start', 'date', 'start_time'),
+        # Swim type filters (e.g. LANE_SWIM) over a date range
+        Index('ix_sessions_swimtype_date', 'swim_type', 'date'),
     )
     
     def __repr__(self):
@@ -71,13 +93,13 @@ class User(Base):
     
     __tablename__ = "users"
     
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
     name = Column(String(255))
     google_id = Column(String(255), unique=True, nullable=False, index=True)
     picture = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), default=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
     
     # Relationships
     favorites = relationship("UserFavorite", back_populates="user", cascade="all, delete-orphan")
@@ -91,10 +113,10 @@ class UserFavorite(Base):
     
     __tablename__ = "user_favorites"
     
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True)
     user_id = Column(BigInteger, ForeignKey("users.id"), nullable=False, index=True)
     facility_id = Column(String, ForeignKey("facilities.facility_id"), nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), default=utcnow)
     
     # Relationships
     user = relationship("User", back_populates="favorites")
@@ -1,5 +1,6 @@
 """Authentication routes."""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from loguru import logger
 import httpx
@@ -12,6 +13,11 @@ from app.auth import create_access_token, get_current_user
 
 router = APIRouter()
 
+# Module-level statements so SQLAlchemy reuses the compiled SQL
+# (google_id and email are both uniquely indexed)
+_USER_BY_GOOGLE_ID = select(User).where(User.google_id == bindparam("google_id"))
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
 
 @router.get("/auth/google-url", tags=["auth"])
 async def get_google_auth_url():
@@ -40,6 +46,7 @@ async def get_google_auth_url():
 @router.post("/auth/google-callback", response_model=TokenResponse, tags=["auth"])
 async def google_callback(
     code: str,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """Handle Google OAuth callback."""
@@ -51,30 +58,30 @@ async def google_callback(
     
     redirect_uri = settings.google_redirect_uri or "http://localhost:5173/auth/callback"
     
-    # Exchange code for token
+    # Exchange code for token using the app-wide client (reuses TLS connections)
+    client: httpx.AsyncClient = request.app.state.http_client
     try:
-        async with httpx.AsyncClient() as client:
-            token_response = await client.post(
-                "https://oauth2.googleapis.com/token",
-                data={
-                    "code": code,
-                    "client_id": settings.google_client_id,
-                    "client_secret": settings.google_client_secret,
-                    "redirect_uri": redirect_uri,
-                    "grant_type": "authorization_code",
-                }
-            )
-            token_response.raise_for_status()
-            token_data = token_response.json()
-            access_token = token_data["access_token"]
-            
-            # Get user info from Google
-            user_response = await client.get(
-                "https://www.googleapis.com/oauth2/v2/userinfo",
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
-            user_response.raise_for_status()
-            google_user = user_response.json()
+        token_response = await client.post(
+            "https://oauth2.googleapis.com/token",
+            data={
+                "code": code,
+                "client_id": settings.google_client_id,
+                "client_secret": settings.google_client_secret,
+                "redirect_uri": redirect_uri,
+                "grant_type": "authorization_code",
+            }
+        )
+        token_response.raise_for_status()
+        token_data = token_response.json()
+        access_token = token_data["access_token"]
+        
+        # Get user info from Google
+        user_response = await client.get(
+            "https://www.googleapis.com/oauth2/v2/userinfo",
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        user_response.raise_for_status()
+        google_user = user_response.json()
     except httpx.HTTPError as e:
         logger.error(f"Google OAuth error: {e}")
         raise HTTPException(
@@ -83,11 +90,15 @@ async def google_callback(
         )
     
     # Get or create user
-    user = db.query(User).filter(User.google_id == google_user["id"]).first()
+    user = db.execute(
+        _USER_BY_GOOGLE_ID, {"google_id": google_user["id"]}
+    ).scalar_one_or_none()
     
     if not user:
         # Check if email already exists (shouldn't happen, but safety check)
-        existing_user = db.query(User).filter(User.email == google_user["email"]).first()
+        existing_user = db.execute(
+            _USER_BY_EMAIL, {"email": google_user["email"]}
+        ).scalar_one_or_none()
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -103,17 +114,15 @@ async def google_callback(
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         logger.info(f"Created new user: {user.email}")
     else:
         # Update existing user info
         user.name = google_user.get("name") or user.name
         user.picture = google_user.get("picture") or user.picture
         db.commit()
-        db.refresh(user)
     
-    # Create JWT token (sub must be string)
-    token = create_access_token(data={"sub": str(user.id)})
+    # Create JWT token (create_access_token encodes sub as a string)
+    token = create_access_token(data={"sub": user.id})
     
     return TokenResponse(
         access_token=token,
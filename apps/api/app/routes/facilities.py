@@ -1,69 +1,103 @@
 """Facilities endpoints."""
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session, aliased, raiseload
+from sqlalchemy import and_, case, func, select
 from sqlalchemy.exc import SQLAlchemyError
 from loguru import logger
 
+from app.cache import cache_response
+from app.config import settings
 from app.database import get_db
+from app.dates import get_today_toronto
 from app.models import Facility, Session as SessionModel
-from app.schemas import FacilityResponse, FacilityWithSessions
-from datetime import date as date_type
+from app.schemas import FacilityResponse, FacilityWithSessions, SessionResponse
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[FacilityWithSessions])
-async def get_facilities(
+@cache_response("facilities", ttl=settings.schedule_cache_ttl, per_day=True)
+def get_facilities(
     district: Optional[str] = Query(None, description="Filter by district"),
     has_lane_swim: bool = Query(False, description="Only facilities with lane swim"),
+    limit: int = Query(500, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db)
 ):
     """Get all facilities with enriched session data."""
     try:
         logger.info(f"Fetching facilities (district={district}, has_lane_swim={has_lane_swim})")
         
-        query = db.query(Facility).filter(Facility.is_indoor.is_(True))
+        today = get_today_toronto()
+        
+        # Aggregate upcoming sessions per facility in one pass
+        upcoming = (
+            select(
+                SessionModel.facility_id,
+                func.count(SessionModel.id).label("session_count"),
+                func.max(
+                    case((SessionModel.swim_type == "LANE_SWIM", 1), else_=0)
+                ).label("has_lane_swim"),
+            )
+            .where(SessionModel.date >= today)
+            .group_by(SessionModel.facility_id)
+            .subquery()
+        )
+        
+        # Rank upcoming sessions so the next one per facility has rank 1
+        ranked = (
+            select(
+                SessionModel,
+                func.row_number().over(
+                    partition_by=SessionModel.facility_id,
+                    order_by=(SessionModel.date, SessionModel.start_time),
+                ).label("rank"),
+            )
+            .where(SessionModel.date >= today)
+            .subquery()
+        )
+        next_session = aliased(SessionModel, ranked)
+        
+        query = (
+            db.query(Facility, next_session, upcoming.c.session_count)
+            .outerjoin(upcoming, upcoming.c.facility_id == Facility.facility_id)
+            .outerjoin(
+                next_session,
+                and_(
+                    next_session.facility_id == Facility.facility_id,
+                    ranked.c.rank == 1,
+                ),
+            )
+            .filter(Facility.is_indoor.is_(True))
+            # Everything the response needs comes from the joins above; fail
+            # loudly instead of lazy-loading sessions once per facility
+            .options(raiseload(Facility.sessions))
+        )
         
         if district:
             query = query.filter(Facility.district.ilike(f"%{district}%"))
         
-        facilities = query.all()
-        logger.debug(f"Found {len(facilities)} facilities")
+        # Filter for lane swim if requested
+        if has_lane_swim:
+            query = query.filter(upcoming.c.has_lane_swim == 1)
         
-        # Enrich with session data
-        result = []
-        today = date_type.today()
+        # Order by name so pages are stable
+        query = query.order_by(Facility.name, Facility.facility_id)
         
-        for facility in facilities:
-            # Get next session
-            next_session = db.query(SessionModel).filter(
-                SessionModel.facility_id == facility.facility_id,
-                SessionModel.date >= today
-            ).order_by(SessionModel.date, SessionModel.start_time).first()
-            
-            # Get total session count
-            session_count = db.query(func.count(SessionModel.id)).filter(
-                SessionModel.facility_id == facility.facility_id,
-                SessionModel.date >= today
-            ).scalar()
-            
-            # Filter for lane swim if requested
-            if has_lane_swim:
-                has_lane = db.query(SessionModel).filter(
-                    SessionModel.facility_id == facility.facility_id,
-                    SessionModel.swim_type == "LANE_SWIM",
-                    SessionModel.date >= today
-                ).first()
-                if not has_lane:
-                    continue
-            
-            result.append(FacilityWithSessions(
-                **facility.__dict__,
-                next_session=next_session,
-                session_count=session_count or 0
-            ))
+        # Pagination
+        rows = query.offset(offset).limit(limit).all()
+        logger.debug(f"Found {len(rows)} facilities")
+        
+        result = []
+        for facility, session, session_count in rows:
+            # Validate from ORM attributes rather than splatting __dict__,
+            # which drags SQLAlchemy state through the Pydantic constructor
+            response = FacilityWithSessions.model_validate(facility)
+            if session is not None:
+                response.next_session = SessionResponse.model_validate(session)
+            response.session_count = session_count or 0
+            result.append(response)
         
         logger.info(f"Returning {len(result)} facilities")
         return result
@@ -83,20 +117,21 @@ async def get_facilities(
 
 
 @router.get("/{facility_id}", response_model=FacilityResponse)
-async def get_facility(
+@cache_response("facility")
+def get_facility(
     facility_id: str,
     db: Session = Depends(get_db)
 ):
     """Get facility by ID."""
     try:
         logger.info(f"Fetching facility {facility_id}")
-        facility = db.query(Facility).filter(Facility.facility_id == facility_id).first()
+        facility = db.get(Facility, facility_id)
         
         if not facility:
             logger.warning(f"Facility {facility_id} not found")
             raise HTTPException(status_code=404, detail="Facility not found")
         
-        return facility
+        return FacilityResponse.model_validate(facility)
         
     except HTTPException:
         raise
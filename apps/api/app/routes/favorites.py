@@ -1,6 +1,6 @@
 """Favorites routes."""
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 from typing import List
 
 from app.database import get_db
@@ -12,40 +12,33 @@ router = APIRouter()
 
 
 @router.get("/favorites", response_model=List[FavoriteResponse], tags=["favorites"])
-async def get_favorites(
+def get_favorites(
     current_user: User = Depends(get_current_user_required),
     db: Session = Depends(get_db)
 ):
     """Get user's favorites."""
+    # Load each favorite's facility from the same JOIN
     favorites = (
         db.query(UserFavorite)
+        .join(UserFavorite.facility)
+        .options(contains_eager(UserFavorite.facility))
         .filter(UserFavorite.user_id == current_user.id)
         .order_by(UserFavorite.created_at.desc())
         .all()
     )
     
-    # Load facility data for each favorite
-    result = []
-    for fav in favorites:
-        facility = db.query(Facility).filter(Facility.facility_id == fav.facility_id).first()
-        result.append(FavoriteResponse(
-            facility_id=fav.facility_id,
-            created_at=fav.created_at,
-            facility=facility
-        ))
-    
-    return result
+    return [FavoriteResponse.model_validate(fav) for fav in favorites]
 
 
 @router.post("/favorites", response_model=FavoriteResponse, tags=["favorites"])
-async def add_favorite(
+def add_favorite(
     favorite: FavoriteCreate,
     current_user: User = Depends(get_current_user_required),
     db: Session = Depends(get_db)
 ):
     """Add a facility to favorites."""
     # Verify facility exists
-    facility = db.query(Facility).filter(Facility.facility_id == favorite.facility_id).first()
+    facility = db.get(Facility, favorite.facility_id)
     if not facility:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -76,7 +69,6 @@ async def add_favorite(
     )
     db.add(new_favorite)
     db.commit()
-    db.refresh(new_favorite)
     
     return FavoriteResponse(
         facility_id=new_favorite.facility_id,
@@ -86,7 +78,7 @@ async def add_favorite(
 
 
 @router.delete("/favorites/{facility_id}", tags=["favorites"])
-async def remove_favorite(
+def remove_favorite(
     facility_id: str,
     current_user: User = Depends(get_current_user_required),
     db: Session = Depends(get_db)
@@ -114,7 +106,7 @@ async def remove_favorite(
 
 
 @router.get("/favorites/check/{facility_id}", tags=["favorites"])
-async def check_favorite(
+def check_favorite(
     facility_id: str,
     current_user: User = Depends(get_current_user_required),
     db: Session = Depends(get_db)
@@ -1,22 +1,38 @@
 """Health check endpoints."""
+import time
 from fastapi import APIRouter, Depends
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
 
-from app.database import get_db
-from app.schemas import HealthResponse
+from app.database import engine, get_db
+from app.routes.update import verify_admin_token
+from app.schemas import HealthResponse, PoolStatusResponse
 from app.config import settings
 
 router = APIRouter()
 
+# Probes arrive several times a second; reuse a recent successful DB check
+HEALTH_CACHE_SECONDS = 5
+_last_healthy_at = 0.0
+
 
 @router.get("/", response_model=HealthResponse)
 @router.get("/health", response_model=HealthResponse)
-async def health_check(db: Session = Depends(get_db)):
+def health_check(db: Session = Depends(get_db)):
     """Health check endpoint."""
+    global _last_healthy_at
+    
+    if time.monotonic() - _last_healthy_at < HEALTH_CACHE_SECONDS:
+        return HealthResponse(
+            status="healthy",
+            version=settings.version
+        )
+    
     # Test database connection
     try:
         db.execute(text("SELECT 1"))
+        _last_healthy_at = time.monotonic()
         return HealthResponse(
             status="healthy",
             version=settings.version
@@ -27,3 +43,18 @@ async def health_check(db: Session = Depends(get_db)):
             version=settings.version
         )
 
+
+@router.get("/debug/pool", response_model=PoolStatusResponse)
+async def pool_status(token: str = Depends(verify_admin_token)):
+    """Database connection pool usage (admin only)."""
+    pool = engine.pool
+    # Only QueuePool keeps these counters (e.g. not NullPool or StaticPool)
+    if not isinstance(pool, QueuePool):
+        return PoolStatusResponse(size=0, checked_in=0, checked_out=0, overflow=0)
+    
+    return PoolStatusResponse(
+        size=pool.size(),
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        overflow=pool.overflow()
+    )
@@ -1,20 +1,36 @@
 """Schedule endpoints."""
 from typing import List
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session, contains_eager, raiseload
 from sqlalchemy import and_
 from datetime import date as date_type, time as time_type
 from typing import Optional
 
+from app.cache import cache_response
+from app.config import settings
 from app.database import get_db
+from app.dates import get_today_toronto
 from app.models import Session as SessionModel, Facility
 from app.schemas import SessionWithFacility
 
 router = APIRouter()
 
+# Validates ORM rows and dumps JSON in one pydantic-core pass
+_sessions_adapter = TypeAdapter(List[SessionWithFacility])
+
+
+def _sessions_with_facility(db: Session):
+    """Query sessions with their facility populated from the same join."""
+    return (
+        db.query(SessionModel)
+        .join(SessionModel.facility)
+        .options(contains_eager(SessionModel.facility), raiseload("*"))
+    )
+
 
 @router.get("/", response_model=List[SessionWithFacility])
-async def get_schedule(
+def get_schedule(
     facility_id: Optional[str] = Query(None, description="Filter by facility"),
     district: Optional[str] = Query(None, description="Filter by district"),
     swim_type: Optional[str] = Query(None, description="Filter by swim type (e.g., LANE_SWIM)"),
@@ -27,7 +43,7 @@ async def get_schedule(
     db: Session = Depends(get_db)
 ):
     """Get swim schedule with filters."""
-    query = db.query(SessionModel).join(Facility)
+    query = _sessions_with_facility(db)
     
     # Apply filters
     filters = []
@@ -45,7 +61,7 @@ async def get_schedule(
         filters.append(SessionModel.date >= date_from)
     else:
         # Default to today onwards
-        filters.append(SessionModel.date >= date_type.today())
+        filters.append(SessionModel.date >= get_today_toronto())
     
     if date_to:
         filters.append(SessionModel.date <= date_to)
@@ -65,30 +81,22 @@ async def get_schedule(
     # Pagination
     sessions = query.offset(offset).limit(limit).all()
     
-    # Enrich with facility data
-    result = []
-    for session in sessions:
-        facility = db.query(Facility).filter(
-            Facility.facility_id == session.facility_id
-        ).first()
-        
-        result.append(SessionWithFacility(
-            **session.__dict__,
-            facility=facility
-        ))
-    
-    return result
+    # Up to 1000 rows: serialize directly instead of letting FastAPI
+    # re-validate the response models before encoding them
+    result = _sessions_adapter.validate_python(sessions, from_attributes=True)
+    return Response(content=_sessions_adapter.dump_json(result), media_type="application/json")
 
 
 @router.get("/today", response_model=List[SessionWithFacility])
-async def get_today_schedule(
+@cache_response("schedule:today", ttl=settings.schedule_cache_ttl, per_day=True)
+def get_today_schedule(
     swim_type: Optional[str] = Query(None, description="Filter by swim type"),
     db: Session = Depends(get_db)
 ):
     """Get today's swim schedule."""
-    today = date_type.today()
+    today = get_today_toronto()
     
-    query = db.query(SessionModel).join(Facility).filter(
+    query = _sessions_with_facility(db).filter(
         SessionModel.date == today
     )
     
@@ -99,16 +107,5 @@ async def get_today_schedule(
     
     sessions = query.all()
     
-    result = []
-    for session in sessions:
-        facility = db.query(Facility).filter(
-            Facility.facility_id == session.facility_id
-        ).first()
-        
-        result.append(SessionWithFacility(
-            **session.__dict__,
-            facility=facility
-        ))
-    
-    return result
+    return [SessionWithFacility.model_validate(session) for session in sessions]
 
@@ -1,17 +1,34 @@
 """Update/refresh endpoints."""
-import subprocess
+import asyncio
+import hmac
 import sys
+import uuid
+from datetime import datetime, timezone
 from pathlib import Path
-from fastapi import APIRouter, Depends, HTTPException, Header
-from sqlalchemy.orm import Session
+from typing import Optional
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Header, status
 from loguru import logger
 
-from app.database import get_db
-from app.schemas import UpdateResponse
+from app.cache import cache_manager
+from app.schemas import UpdateJobResponse, UpdateResponse
 from app.config import settings
 
 router = APIRouter()
 
+# Cached read endpoints that depend on pipeline data
+CACHED_PREFIXES = ("facilities", "facility", "schedule")
+
+UPDATE_TIMEOUT = 300  # 5 minutes
+JOB_STATUS_TTL = 24 * 60 * 60  # Keep job status for a day
+UPDATE_LOCK_KEY = "update:running"
+
+# Job status for this worker. Redis is optional, so status is always kept
+# here too; only event-loop code touches it, so it needs no lock.
+_local_jobs: TTLCache = TTLCache(maxsize=1000, ttl=JOB_STATUS_TTL)
+# Refresh started by this worker, if one is queued or running
+_active_job_id: Optional[str] = None
+
 
 def verify_admin_token(authorization: str = Header(None)):
     """Verify admin token."""
@@ -24,60 +41,149 @@ def verify_admin_token(authorization: str = Header(None)):
         raise HTTPException(status_code=401, detail="Invalid authorization header")
     
     token = parts[1]
-    if token != settings.admin_token:
+    # Constant-time compare; bytes so non-ASCII headers don't raise TypeError
+    if not hmac.compare_digest(token.encode(), settings.admin_token.encode()):
         raise HTTPException(status_code=403, detail="Invalid token")
     
     return token
 
 
-@router.post("/", response_model=UpdateResponse)
-async def trigger_update(
-    token: str = Depends(verify_admin_token),
-    db: Session = Depends(get_db)
-):
-    """Trigger data refresh (admin only)."""
-    logger.info("Manual update triggered")
+def _find_refresh_script() -> Optional[Path]:
+    """Locate the daily refresh script."""
+    script_path = Path("/data-pipeline/jobs/daily_refresh.py")
+    
+    if not script_path.exists():
+        # Fallback for local development
+        script_path = Path(__file__).parent.parent.parent.parent / "data-pipeline" / "jobs" / "daily_refresh.py"
+    
+    return script_path if script_path.exists() else None
+
+
+def _job_key(job_id: str) -> str:
+    return f"update:job:{job_id}"
+
+
+async def _set_job_status(job: UpdateJobResponse) -> None:
+    """Record job status locally and in Redis so any worker can report it."""
+    data = job.model_dump(mode="json")
+    _local_jobs[job.job_id] = data
+    await cache_manager.set(_job_key(job.job_id), data, ttl=JOB_STATUS_TTL)
+
+
+async def _get_job_status(job_id: str) -> Optional[dict]:
+    """Look a job up in Redis, falling back to this worker's record."""
+    job = await cache_manager.get(_job_key(job_id))
+    return job if job is not None else _local_jobs.get(job_id)
+
+
+async def _release_refresh(job_id: str) -> None:
+    """Let the next refresh start once this one has finished."""
+    global _active_job_id
+    if _active_job_id == job_id:
+        _active_job_id = None
+    await cache_manager.delete(UPDATE_LOCK_KEY)
+
+
+async def run_refresh(job_id: str, script_path: Path) -> None:
+    """Run the refresh script without blocking the event loop."""
+    job = UpdateJobResponse(
+        job_id=job_id,
+        status="running",
+        started_at=datetime.now(timezone.utc)
+    )
+    await _set_job_status(job)
     
     try:
-        # Run the daily refresh script
-        script_path = Path("/data-pipeline/jobs/daily_refresh.py")
-        
-        if not script_path.exists():
-            # Fallback for local development
-            script_path = Path(__file__).parent.parent.parent.parent / "data-pipeline" / "jobs" / "daily_refresh.py"
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, str(script_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            _, stderr = await asyncio.wait_for(process.communicate(), timeout=UPDATE_TIMEOUT)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
         
-        if script_path.exists():
-            result = subprocess.run(
-                [sys.executable, str(script_path)],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minutes timeout
-            )
-            
-            if result.returncode == 0:
-                logger.info("Update completed successfully")
-                return UpdateResponse(
-                    success=True,
-                    message="Data refresh completed successfully",
-                    facilities_updated=0,  # Parse from output if needed
-                    sessions_added=0
-                )
-            else:
-                logger.error(f"Update failed: {result.stderr}")
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Update failed: {result.stderr[:200]}"
-                )
+        if process.returncode == 0:
+            logger.info(f"Update {job_id} completed successfully")
+            for prefix in CACHED_PREFIXES:
+                await cache_manager.delete_pattern(f"{prefix}:*")
+            job.status = "completed"
+            job.message = "Data refresh completed successfully"
         else:
-            raise HTTPException(
-                status_code=500,
-                detail="Update script not found"
-            )
+            error = stderr.decode(errors="replace")
+            logger.error(f"Update {job_id} failed: {error}")
+            job.status = "failed"
+            job.message = f"Update failed: {error[:200]}"
     
-    except subprocess.TimeoutExpired:
-        logger.error("Update timed out")
-        raise HTTPException(status_code=500, detail="Update timed out")
+    except asyncio.TimeoutError:
+        logger.error(f"Update {job_id} timed out")
+        job.status = "failed"
+        job.message = "Update timed out"
     except Exception as e:
-        logger.exception(f"Update error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception(f"Update {job_id} error: {e}")
+        job.status = "failed"
+        job.message = str(e)
+    
+    job.finished_at = datetime.now(timezone.utc)
+    await _set_job_status(job)
+    await _release_refresh(job_id)
+
+
+@router.post("/", response_model=UpdateResponse, status_code=status.HTTP_202_ACCEPTED)
+async def trigger_update(
+    background_tasks: BackgroundTasks,
+    token: str = Depends(verify_admin_token)
+):
+    """Queue a data refresh (admin only)."""
+    global _active_job_id
+    logger.info("Manual update triggered")
+    
+    script_path = _find_refresh_script()
+    if not script_path:
+        raise HTTPException(
+            status_code=500,
+            detail="Update script not found"
+        )
+    
+    # Claim the slot before any await so concurrent requests can't both pass
+    if _active_job_id is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Data refresh {_active_job_id} is already running"
+        )
+    job_id = uuid.uuid4().hex
+    _active_job_id = job_id
+    
+    # Other workers' refreshes are visible only through Redis; the lock
+    # expires on its own if a worker dies mid-refresh
+    if await cache_manager.add(UPDATE_LOCK_KEY, job_id, ttl=UPDATE_TIMEOUT + 60) is False:
+        _active_job_id = None
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A data refresh is already running"
+        )
+    
+    await _set_job_status(UpdateJobResponse(job_id=job_id, status="queued"))
+    background_tasks.add_task(run_refresh, job_id, script_path)
+    
+    return UpdateResponse(
+        success=True,
+        message="Data refresh queued",
+        job_id=job_id
+    )
+
 
+@router.get("/{job_id}", response_model=UpdateJobResponse)
+async def get_update_status(
+    job_id: str,
+    token: str = Depends(verify_admin_token)
+):
+    """Get the status of a queued data refresh (admin only)."""
+    job = await _get_job_status(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return job
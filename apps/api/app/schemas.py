@@ -1,7 +1,11 @@
 """Pydantic schemas for API."""
-from datetime import date, time, datetime
+from datetime import date, time, datetime, timezone
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
 
 
 class FacilityBase(BaseModel):
@@ -29,8 +33,7 @@ class FacilityResponse(FacilityBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FacilityWithSessions(FacilityResponse):
@@ -60,8 +63,7 @@ class SessionResponse(SessionBase):
     source: Optional[str] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SessionWithFacility(SessionResponse):
@@ -89,14 +91,32 @@ class UpdateResponse(BaseModel):
     message: str
     facilities_updated: int = 0
     sessions_added: int = 0
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    job_id: Optional[str] = None
+    timestamp: datetime = Field(default_factory=_utcnow)
+
+
+class UpdateJobResponse(BaseModel):
+    """Status of a queued data refresh."""
+    job_id: str
+    status: str  # queued, running, completed, failed
+    message: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class PoolStatusResponse(BaseModel):
+    """Database connection pool status."""
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
 
 
 class HealthResponse(BaseModel):
     """Health check response."""
     status: str
     version: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class UserBase(BaseModel):
@@ -116,8 +136,7 @@ class UserResponse(UserBase):
     id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TokenResponse(BaseModel):
@@ -133,8 +152,7 @@ class FavoriteResponse(BaseModel):
     created_at: datetime
     facility: Optional[FacilityResponse] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FavoriteCreate(BaseModel):
@@ -1,12 +1,14 @@
 """Pytest fixtures and configuration."""
+from datetime import date, time, timedelta
+
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.models import Base
+from app.models import Base, Facility, Session
 from app.database import get_db
 
 
@@ -18,23 +20,56 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-@pytest.fixture(scope="function")
-def db():
-    """Create a fresh database for each test."""
+# pysqlite emits its own BEGIN/COMMIT, which breaks SAVEPOINTs; let
+# SQLAlchemy control transactions instead
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _begin_transaction(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
+def _schema():
+    """Create the schema once for the whole test run."""
     Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db(_schema):
+    """Run each test inside a transaction that is rolled back afterwards."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    # Commits inside the test (fixtures and routes) only release SAVEPOINTs
+    db = sessionmaker(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint"
+    )()
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def _app_client():
+    """Run app startup/shutdown once for the whole test run."""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(db):
+def client(_app_client, db):
     """Create a test client with database dependency override."""
     def override_get_db():
         try:
@@ -44,8 +79,7 @@ def client(db):
 
     app.dependency_overrides[get_db] = override_get_db
     
-    with TestClient(app) as test_client:
-        yield test_client
+    yield _app_client
     
     app.dependency_overrides.clear()
 
@@ -53,9 +87,8 @@ def client(db):
 @pytest.fixture
 def sample_facility(db):
     """Create a sample facility for testing."""
-    from app.models import Facility
-    
-    facility = Facility(
+    # A single INSERT ... RETURNING; the outer transaction discards it
+    return db.scalar(insert(Facility).returning(Facility).values(
         facility_id="TEST001",
         name="Test Pool",
         address="123 Test St",
@@ -66,31 +99,20 @@ def sample_facility(db):
         is_indoor=True,
         phone="416-555-0100",
         source="test"
-    )
-    db.add(facility)
-    db.commit()
-    db.refresh(facility)
-    return facility
+    ))
 
 
 @pytest.fixture
 def sample_session(db, sample_facility):
     """Create a sample session for testing."""
-    from app.models import Session
-    from datetime import date, time
-    
-    session = Session(
+    return db.scalar(insert(Session).returning(Session).values(
         facility_id=sample_facility.facility_id,
         swim_type="LANE_SWIM",
-        date=date(2025, 11, 10),
+        date=date.today() + timedelta(days=1),
         start_time=time(18, 0),
         end_time=time(20, 0),
         notes="Test session",
         source="test",
-        hash="test-hash-123"
-    )
-    db.add(session)
-    db.commit()
-    db.refresh(session)
-    return session
+        hash=b"test-hash-123"
+    ))
 
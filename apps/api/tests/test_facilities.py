@@ -1,4 +1,7 @@
 """Test facility endpoints."""
+from datetime import date, time, timedelta
+
+from app.models import Session
 
 
 def test_get_facilities(client, sample_facility):
@@ -34,3 +37,44 @@ def test_filter_facilities_by_district(client, sample_facility):
     assert len(data) >= 1
     assert all("Test" in f.get("district", "") for f in data)
 
+
+def test_facilities_include_upcoming_sessions(client, db, sample_facility):
+    """Test facilities are enriched with next session and count."""
+    tomorrow = date.today() + timedelta(days=1)
+    db.add_all([
+        Session(
+            facility_id=sample_facility.facility_id,
+            swim_type="LANE_SWIM",
+            date=tomorrow,
+            start_time=time(18, 0),
+            end_time=time(19, 0),
+            hash=b"upcoming-hash-1"
+        ),
+        Session(
+            facility_id=sample_facility.facility_id,
+            swim_type="RECREATIONAL",
+            date=tomorrow,
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+            hash=b"upcoming-hash-2"
+        ),
+    ])
+    db.commit()
+
+    response = client.get("/facilities/?has_lane_swim=true")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["session_count"] == 2
+    assert data[0]["next_session"]["start_time"] == "09:00:00"
+
+
+def test_facilities_pagination(client, sample_facility):
+    """Test facilities limit and offset."""
+    response = client.get("/facilities/?limit=1")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    
+    response = client.get("/facilities/?offset=1000")
+    assert response.status_code == 200
+    assert response.json() == []
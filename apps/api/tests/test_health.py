@@ -17,3 +17,24 @@ def test_root_endpoint(client):
     data = response.json()
     assert data["status"] in ["healthy", "unhealthy"]
 
+
+
+def test_pool_status_requires_admin_token(client):
+    """Test pool status endpoint is admin only."""
+    response = client.get("/debug/pool")
+    assert response.status_code == 401
+
+
+def test_pool_status(client):
+    """Test pool status endpoint."""
+    response = client.get("/debug/pool", headers={"Authorization": "Bearer test-token"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["size"] >= 0
+    assert data["checked_out"] >= 0
+
+
+def test_pool_status_rejects_wrong_token(client):
+    """Test pool status endpoint rejects an invalid admin token."""
+    response = client.get("/debug/pool", headers={"Authorization": "Bearer wrong-token"})
+    assert response.status_code == 403
@@ -0,0 +1,46 @@
+"""Test update endpoints."""
+from pathlib import Path
+
+from app.routes import update
+
+ADMIN_HEADERS = {"Authorization": "Bearer test-token"}
+
+
+def test_update_status_without_redis(client, monkeypatch):
+    """Test job status is reported when Redis is not configured."""
+    started = []
+
+    async def fake_refresh(job_id, script_path):
+        started.append(job_id)
+
+    monkeypatch.setattr(update, "run_refresh", fake_refresh)
+    monkeypatch.setattr(update, "_find_refresh_script", lambda: Path("daily_refresh.py"))
+    monkeypatch.setattr(update, "_active_job_id", None)
+
+    response = client.post("/update/", headers=ADMIN_HEADERS)
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+    assert started == [job_id]
+
+    response = client.get(f"/update/{job_id}", headers=ADMIN_HEADERS)
+    assert response.status_code == 200
+    assert response.json()["status"] == "queued"
+
+
+def test_update_rejects_overlapping_refresh(client, monkeypatch):
+    """Test a second refresh is refused while one is running."""
+    async def fake_refresh(job_id, script_path):
+        pass
+
+    monkeypatch.setattr(update, "run_refresh", fake_refresh)
+    monkeypatch.setattr(update, "_find_refresh_script", lambda: Path("daily_refresh.py"))
+    monkeypatch.setattr(update, "_active_job_id", "running-job")
+
+    response = client.post("/update/", headers=ADMIN_HEADERS)
+    assert response.status_code == 409
+
+
+def test_get_unknown_update_job(client):
+    """Test status of an unknown job."""
+    response = client.get("/update/missing", headers=ADMIN_HEADERS)
+    assert response.status_code == 404
@@ -3,19 +3,41 @@
 
 import re
 import sys
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import requests
+from requests.adapters import HTTPAdapter
+
+# Reused across calls so repeat fetches from toronto.ca keep the connection alive
+_session = requests.Session()
+_session.headers.update({
+    "User-Agent": "Mozilla/5.0 (compatible; SwimTO/1.0; +https://github.com/raolivei/swimTO)"
+})
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+_WEEK_RE = re.compile(r'For the week of', re.IGNORECASE)
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+# Only build the parts of the page we inspect: week headers and tables
+_STRAINER = SoupStrainer(["table", "h1", "h2", "h3", "h4", "p", "div"])
+
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session (e.g. to mount a retrying adapter)."""
+    return _session
+
 
 def check_multi_week_schedule(url):
     """Check how many weeks of schedule a facility page shows."""
     try:
         print(f"Fetching: {url}")
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Parse straight from the socket instead of buffering response.content
+        with _session.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True  # Undo gzip/deflate transparently
+            soup = BeautifulSoup(response.raw, 'lxml', parse_only=_STRAINER)
         
         # Look for "For the week of..." patterns
-        week_headers = soup.find_all(text=re.compile(r'For the week of', re.IGNORECASE))
+        week_headers = soup.find_all(string=_WEEK_RE)
         
         print(f"\n✅ Found {len(week_headers)} 'For the week of...' sections")
         
@@ -26,7 +48,7 @@ def check_multi_week_schedule(url):
                 print(f"  {i}. {week_text}")
                 
                 # Try to extract the date
-                date_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', week_text)
+                date_match = _DATE_RE.search(week_text)
                 if date_match:
                     print(f"     → Date: {date_match.group(0)}")
         else:
@@ -40,7 +62,7 @@ def check_multi_week_schedule(url):
             if tables:
                 print("\nFirst table headers:")
                 first_table = tables[0]
-                headers = first_table.find_all(['th', 'td'])[:10]
+                headers = first_table.find_all(['th', 'td'], limit=10)
                 for h in headers:
                     print(f"  - {h.get_text(strip=True)}")
         
@@ -1,100 +1,163 @@
 #!/usr/bin/env python3
 """Daily refresh job to update pool schedules."""
+import argparse
+import hashlib
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from loguru import logger
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, delete, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import sessionmaker
 
-from config import settings
-from models import Base, Facility, Session
-from sources.open_data import OpenDataClient
+from config import get_settings
+from models import Facility, Session
 from sources.pools_xml_parser import PoolsXMLParser
-from sources.facility_scraper import FacilityScraper
 from sources.toronto_pools_data import get_all_indoor_pools
 from sources.toronto_drop_in_api import TorontoDropInAPI
 from sources.toronto_parks_json_api import TorontoParksJSONAPI
 from sources.curated_json_facilities import get_json_api_facilities
 
 
-def setup_logging():
+def setup_logging(debug_log: bool = False):
     """Configure logging."""
+    log_level = get_settings().log_level
     logger.remove()
     logger.add(
         sys.stderr,
-        level=settings.log_level,
+        level=log_level,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>"
     )
-    logger.add(
-        "logs/daily_refresh_{time}.log",
-        rotation="1 day",
-        retention="30 days",
-        level="DEBUG"
-    )
+    # The DEBUG file sink logs every session; only enable it when asked for
+    if debug_log or log_level.upper() == "DEBUG" or os.getenv("PIPELINE_DEBUG_LOG"):
+        logger.add(
+            "logs/daily_refresh_{time}.log",
+            rotation="1 day",
+            retention="30 days",
+            level="DEBUG"
+        )
 
 
 def setup_database():
-    """Set up database connection."""
-    engine = create_engine(settings.database_url)
-    Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
+    """Set up database connection.
+
+    The schema comes from the API's Alembic migrations (`make migrate`).
+    """
+    # Fetch phases can leave the connection idle for minutes; keep it alive
+    # and check it on checkout so the next write doesn't hit a dead socket
+    engine = create_engine(
+        get_settings().database_url,
+        pool_pre_ping=True,
+        connect_args={
+            'keepalives': 1,
+            'keepalives_idle': 30,
+            'keepalives_interval': 10,
+            'keepalives_count': 5
+        }
+    )
+    # Ingesters write through bulk/Core statements and track dedupe state in
+    # memory, so implicit flushes and post-commit re-SELECTs are pure overhead
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
     return SessionLocal()
 
 
+# Facility columns the curated list owns and refreshes on every run
+_CURATED_COLUMNS = (
+    'name', 'address', 'postal_code', 'district', 'latitude',
+    'longitude', 'is_indoor', 'phone', 'website'
+)
+
+
 def ingest_curated_facilities(db_session):
     """Ingest curated facility data from toronto_pools_data."""
     logger.info("Ingesting curated facility data")
     
-    facilities = get_all_indoor_pools()
-    
-    ingested = 0
-    updated = 0
-    for facility_data in facilities:
+    # Keyed by generated ID so a repeated name upserts once (last wins)
+    rows = {}
+    for facility_data in get_all_indoor_pools():
         # Generate facility_id from name (normalized)
         facility_id = facility_data['name'].lower().replace(' ', '-').replace("'", '')
-        
-        # Check if exists
-        existing = db_session.query(Facility).filter_by(facility_id=facility_id).first()
-        
-        if existing:
-            # Update
-            existing.name = facility_data.get('name', existing.name)
-            existing.address = facility_data.get('address', existing.address)
-            existing.postal_code = facility_data.get('postal_code', existing.postal_code)
-            existing.district = facility_data.get('district', existing.district)
-            existing.latitude = facility_data.get('latitude', existing.latitude)
-            existing.longitude = facility_data.get('longitude', existing.longitude)
-            existing.is_indoor = facility_data.get('is_indoor', existing.is_indoor)
-            existing.phone = facility_data.get('phone', existing.phone)
-            existing.website = facility_data.get('website', existing.website)
-            existing.updated_at = datetime.utcnow()
-            updated += 1
-        else:
-            # Insert
-            facility = Facility(
-                facility_id=facility_id,
-                name=facility_data.get('name', ''),
-                address=facility_data.get('address'),
-                postal_code=facility_data.get('postal_code'),
-                district=facility_data.get('district'),
-                latitude=facility_data.get('latitude'),
-                longitude=facility_data.get('longitude'),
-                is_indoor=facility_data.get('is_indoor', True),
-                phone=facility_data.get('phone'),
-                website=facility_data.get('website'),
-                source='curated',
-                raw=facility_data
-            )
-            db_session.add(facility)
-            ingested += 1
+        rows[facility_id] = {
+            'facility_id': facility_id,
+            'name': facility_data.get('name', ''),
+            'address': facility_data.get('address'),
+            'postal_code': facility_data.get('postal_code'),
+            'district': facility_data.get('district'),
+            'latitude': facility_data.get('latitude'),
+            'longitude': facility_data.get('longitude'),
+            'is_indoor': facility_data.get('is_indoor', True),
+            'phone': facility_data.get('phone'),
+            'website': facility_data.get('website'),
+            'source': 'curated',
+            'raw': facility_data
+        }
+    if not rows:
+        return
     
+    # Only needed for the log counts; one query for all IDs
+    existing = set(db_session.execute(
+        select(Facility.facility_id).where(Facility.facility_id.in_(list(rows)))
+    ).scalars())
+    
+    # Single upsert; existing rows keep their source, raw payload and created_at
+    stmt = pg_insert(Facility).values(list(rows.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Facility.facility_id],
+        set_={
+            **{column: stmt.excluded[column] for column in _CURATED_COLUMNS},
+            'updated_at': func.now()
+        },
+        # Leave unchanged rows alone: no write, no WAL, no updated_at bump
+        where=tuple_(*(Facility.__table__.c[column] for column in _CURATED_COLUMNS)).is_distinct_from(
+            tuple_(*(stmt.excluded[column] for column in _CURATED_COLUMNS))
+        )
+    ).returning(Facility.facility_id)
+    written = len(db_session.execute(stmt).all())
+    
+    ingested = len(rows) - len(existing)
+    updated = written - ingested
+    db_session.commit()
+    logger.info(
+        f"Ingested {ingested} new facilities, updated {updated} existing facilities, "
+        f"{len(existing) - updated} unchanged"
+    )
+
+
+# Facility rows written per transaction in ingest_facilities
+FACILITY_BATCH_SIZE = 500
+
+# Session rows the schedule ingesters write before committing
+SESSION_COMMIT_ROWS = 5000
+
+# Facility columns that XML rows may overwrite
+_FACILITY_COLUMNS = frozenset(column.key for column in Facility.__table__.columns)
+
+
+def _facility_columns(facility_data):
+    """Non-null values from a parsed row that map onto Facility columns."""
+    return {
+        key: value for key, value in facility_data.items()
+        if key in _FACILITY_COLUMNS and value is not None
+    }
+
+
+def _write_facility_batch(db_session, updates, new_rows):
+    """Write one batch of facility mappings in its own transaction."""
+    db_session.bulk_update_mappings(Facility, updates)
+    if new_rows:
+        # Another refresh may have inserted some of these facilities first;
+        # skip just those rows instead of failing the whole batch
+        db_session.execute(
+            pg_insert(Facility).on_conflict_do_nothing(index_elements=[Facility.facility_id]),
+            new_rows
+        )
     db_session.commit()
-    logger.info(f"Ingested {ingested} new facilities, updated {updated} existing facilities")
 
 
 def ingest_facilities(db_session):
@@ -104,43 +167,53 @@ def ingest_facilities(db_session):
     parser = PoolsXMLParser()
     facilities = parser.fetch_and_parse()
     
+    # Load existing facility sources once instead of querying per XML row
+    existing_sources = dict(db_session.execute(select(Facility.facility_id, Facility.source)).all())
+    updates = {}
+    new_rows = {}
+    
     ingested = 0
     for facility_data in facilities:
         facility_id = facility_data.get('facility_id')
         if not facility_id:
             continue
         
-        # Check if exists
-        existing = db_session.query(Facility).filter_by(facility_id=facility_id).first()
-        
-        if existing:
+        if facility_id in new_rows:
+            # Repeated ID within the XML: later values win, as for updates
+            new_rows[facility_id].update(_facility_columns(facility_data))
+        elif facility_id in existing_sources:
             # Update only if not from curated source
-            if existing.source != 'curated':
-                for key, value in facility_data.items():
-                    if hasattr(existing, key) and value is not None:
-                        setattr(existing, key, value)
-                existing.updated_at = datetime.utcnow()
+            if existing_sources[facility_id] != 'curated':
+                row = updates.setdefault(facility_id, {'facility_id': facility_id})
+                row.update(_facility_columns(facility_data))
         else:
             # Insert
-            facility = Facility(
-                facility_id=facility_id,
-                name=facility_data.get('name', ''),
-                address=facility_data.get('address'),
-                postal_code=facility_data.get('postal_code'),
-                district=facility_data.get('district'),
-                latitude=facility_data.get('latitude'),
-                longitude=facility_data.get('longitude'),
-                is_indoor=facility_data.get('is_indoor', True),
-                phone=facility_data.get('phone'),
-                website=facility_data.get('website'),
-                source='pools_xml',
-                raw=facility_data
-            )
-            db_session.add(facility)
+            new_rows[facility_id] = {
+                'facility_id': facility_id,
+                'name': facility_data.get('name', ''),
+                'address': facility_data.get('address'),
+                'postal_code': facility_data.get('postal_code'),
+                'district': facility_data.get('district'),
+                'latitude': facility_data.get('latitude'),
+                'longitude': facility_data.get('longitude'),
+                'is_indoor': facility_data.get('is_indoor', True),
+                'phone': facility_data.get('phone'),
+                'website': facility_data.get('website'),
+                'source': 'pools_xml',
+                'raw': facility_data
+            }
         
         ingested += 1
-    
-    db_session.commit()
+        
+        # Commit in batches to bound transaction size
+        if len(updates) + len(new_rows) >= FACILITY_BATCH_SIZE:
+            _write_facility_batch(db_session, list(updates.values()), list(new_rows.values()))
+            # Repeats of just-inserted IDs are updates from here on
+            existing_sources.update(dict.fromkeys(new_rows, 'pools_xml'))
+            updates.clear()
+            new_rows.clear()
+    
+    _write_facility_batch(db_session, list(updates.values()), list(new_rows.values()))
     logger.info(f"Processed {ingested} facilities from XML")
 
 
@@ -173,11 +246,20 @@ def ingest_official_schedules(db_session):
     # Get all existing facilities for matching
     existing_facilities = db_session.query(Facility).all()
     
+    # Generated session dates never precede today, so this covers every
+    # hash that could collide; checked in memory instead of a SELECT each
+    existing_hashes = set(db_session.execute(
+        select(Session.hash).where(Session.date >= date.today())
+    ).scalars())
+    
     total_sessions = 0
     total_inserted = 0
     total_skipped = 0
+    uncommitted = 0
     facilities_processed = set()
     unmatched_locations = set()
+    # Many programs share a location; match each location only once
+    facility_matches = {}
     
     for program in swim_programs:
         location_id = api.get_field(program, 'Location ID', 'LocationID', 'Location_ID')
@@ -195,12 +277,15 @@ def ingest_official_schedules(db_session):
         
         # Try to match facility
         facility_name = sessions[0]['facility_name']
-        facility_id = api.match_facility(
-            facility_name,
-            location_id,
-            location,
-            existing_facilities
-        )
+        match_key = (facility_name, location_id)
+        if match_key not in facility_matches:
+            facility_matches[match_key] = api.match_facility(
+                facility_name,
+                location_id,
+                location,
+                existing_facilities
+            )
+        facility_id = facility_matches[match_key]
         
         if not facility_id:
             unmatched_locations.add(f"{facility_name} (ID: {location_id})")
@@ -209,7 +294,8 @@ def ingest_official_schedules(db_session):
         
         facilities_processed.add(facility_id)
         
-        # Insert sessions
+        # Collect plain rows and insert the program's sessions in one batch
+        pending = []
         for session_data in sessions:
             try:
                 # Generate hash for deduplication
@@ -220,38 +306,54 @@ def ingest_official_schedules(db_session):
                     session_data['swim_type']
                 )
                 
-                # Check if exists
-                existing = db_session.query(Session).filter_by(hash=session_hash).first()
-                
-                if not existing:
-                    # Insert new session
-                    new_session = Session(
-                        facility_id=facility_id,
-                        swim_type=session_data['swim_type'],
-                        date=session_data['date'],
-                        start_time=session_data['start_time'],
-                        end_time=session_data['end_time'],
-                        notes=session_data.get('notes'),
-                        source='toronto_open_data',
-                        hash=session_hash
-                    )
-                    db_session.add(new_session)
+                if session_hash not in existing_hashes:
+                    pending.append({
+                        'facility_id': facility_id,
+                        'swim_type': session_data['swim_type'],
+                        'date': session_data['date'],
+                        'start_time': session_data['start_time'],
+                        'end_time': session_data['end_time'],
+                        'notes': session_data.get('notes'),
+                        'source': 'toronto_open_data',
+                        'hash': session_hash
+                    })
+                    existing_hashes.add(session_hash)
                     total_inserted += 1
                     
+                    # Per-session: let loguru skip formatting unless DEBUG is on
                     logger.debug(
-                        f"Inserted: {facility_name} - {session_data['swim_type']} "
-                        f"on {session_data['date']} at {session_data['start_time']}"
+                        "Inserted: {} - {} on {} at {}",
+                        facility_name, session_data['swim_type'],
+                        session_data['date'], session_data['start_time']
                     )
                 
                 total_sessions += 1
                 
             except Exception as e:
                 logger.error(f"Error inserting session: {e}")
-                db_session.rollback()
                 continue
         
-        # Commit after each program to avoid losing progress
-        db_session.commit()
+        # Fully deduped programs (the usual rerun case) need no SAVEPOINT
+        if not pending:
+            continue
+        
+        try:
+            # SAVEPOINT so a bad program discards only its own rows
+            with db_session.begin_nested():
+                db_session.bulk_insert_mappings(Session, pending)
+        except Exception as e:
+            logger.error(f"Error inserting sessions for {facility_name}: {e}")
+            existing_hashes.difference_update(row['hash'] for row in pending)
+            total_inserted -= len(pending)
+            continue
+        
+        uncommitted += len(pending)
+        # Commit in large batches rather than after every program
+        if uncommitted >= SESSION_COMMIT_ROWS:
+            db_session.commit()
+            uncommitted = 0
+    
+    db_session.commit()
     
     logger.info("=" * 60)
     logger.success(f"✓ Processed {len(swim_programs)} swim programs")
@@ -294,85 +396,106 @@ def ingest_json_api_schedules(db_session):
     total_sessions = 0
     total_inserted = 0
     total_skipped = 0
+    uncommitted = 0
+    
+    # One query for all configured IDs instead of one per facility
+    known_ids = set(db_session.execute(
+        select(Facility.facility_id).where(Facility.facility_id.in_(list(json_facilities)))
+    ).scalars())
     
+    to_fetch = {}
     for facility_id, facility_info in json_facilities.items():
-        location_id = facility_info.get('location_id')
-        facility_name = facility_info.get('name')
-        
-        if not location_id:
+        if not facility_info.get('location_id'):
             logger.warning(f"No location_id for facility: {facility_id}")
             continue
         
-        logger.info(f"Processing {facility_name} (location_id={location_id})")
-        
-        # Check if facility exists in database
-        existing_facility = db_session.query(Facility).filter_by(facility_id=facility_id).first()
-        if not existing_facility:
+        if facility_id not in known_ids:
             logger.warning(f"Facility not found in database: {facility_id}")
             logger.warning(f"Please add it to toronto_pools_data.py first")
             continue
         
-        try:
-            # Fetch schedule data
-            sessions = api.fetch_facility_schedule(location_id, weeks_ahead=4)
-            
-            if not sessions:
-                logger.warning(f"No sessions found for {facility_name}")
-                continue
-            
-            # Delete all existing sessions for this facility to ensure 100% accuracy
-            # This prevents stale data and ensures we match the official source exactly
-            deleted_count = db_session.query(Session).filter_by(facility_id=facility_id).delete()
-            if deleted_count > 0:
-                logger.info(f"  Deleted {deleted_count} existing sessions for {facility_name}")
-                db_session.commit()
+        to_fetch[facility_id] = facility_info
+    
+    # Schedules are fetched concurrently; all DB writes stay on this thread
+    with ThreadPoolExecutor(max_workers=SCRAPE_WORKERS) as executor:
+        futures = {
+            executor.submit(api.fetch_facility_schedule, facility_info['location_id'], weeks_ahead=4): facility_id
+            for facility_id, facility_info in to_fetch.items()
+        }
+        
+        for future in as_completed(futures):
+            facility_id = futures[future]
+            location_id = to_fetch[facility_id]['location_id']
+            facility_name = to_fetch[facility_id].get('name')
+            logger.info(f"Processing {facility_name} (location_id={location_id})")
             
-            # Insert sessions
-            for session_data in sessions:
-                try:
-                    # Generate hash for deduplication
-                    import hashlib
-                    hash_content = f"{facility_id}:{session_data['date']}:{session_data['start_time']}:{session_data['swim_type']}"
-                    session_hash = hashlib.sha256(hash_content.encode()).hexdigest()
-                    
-                    # Check if exists
-                    existing = db_session.query(Session).filter_by(hash=session_hash).first()
-                    
-                    if not existing:
-                        # Insert new session
-                        new_session = Session(
-                            facility_id=facility_id,
-                            swim_type=session_data['swim_type'],
-                            date=session_data['date'],
-                            start_time=session_data['start_time'],
-                            end_time=session_data['end_time'],
-                            notes=session_data.get('notes'),
-                            source='toronto_parks_json_api',
-                            hash=session_hash
-                        )
-                        db_session.add(new_session)
-                        total_inserted += 1
-                        
-                        logger.debug(
-                            f"Inserted: {facility_name} - {session_data['swim_type']} "
-                            f"on {session_data['date']} at {session_data['start_time']}"
-                        )
-                    
-                    total_sessions += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error inserting session: {e}")
-                    db_session.rollback()
+            try:
+                sessions = future.result()
+                
+                if not sessions:
+                    logger.warning(f"No sessions found for {facility_name}")
                     continue
-            
-            # Commit after each facility
-            db_session.commit()
-            logger.success(f"✓ Processed {len(sessions)} sessions for {facility_name}")
-            
-        except Exception as e:
-            logger.error(f"Error processing {facility_name}: {e}")
-            db_session.rollback()
-            continue
+                
+                # The facility's rows are replaced below and hashes include
+                # the facility ID, so only duplicates within this batch collide
+                seen_hashes = set()
+                
+                # Collect plain rows and insert the facility's sessions in one batch
+                pending = []
+                for session_data in sessions:
+                    try:
+                        # Generate hash for deduplication
+                        hash_content = f"{facility_id}:{session_data['date']}:{session_data['start_time']}:{session_data['swim_type']}"
+                        session_hash = hashlib.blake2b(hash_content.encode(), digest_size=16).digest()
+                        
+                        if session_hash not in seen_hashes:
+                            pending.append({
+                                'facility_id': facility_id,
+                                'swim_type': session_data['swim_type'],
+                                'date': session_data['date'],
+                                'start_time': session_data['start_time'],
+                                'end_time': session_data['end_time'],
+                                'notes': session_data.get('notes'),
+                                'source': 'toronto_parks_json_api',
+                                'hash': session_hash
+                            })
+                            seen_hashes.add(session_hash)
+                            
+                            # Per-session: let loguru skip formatting unless DEBUG is on
+                            logger.debug(
+                                "Inserted: {} - {} on {} at {}",
+                                facility_name, session_data['swim_type'],
+                                session_data['date'], session_data['start_time']
+                            )
+                        
+                        total_sessions += 1
+                        
+                    except Exception as e:
+                        logger.error(f"Error inserting session: {e}")
+                        continue
+                
+                # Swap the facility's sessions in a SAVEPOINT so a failure
+                # only discards this facility, not the uncommitted batch
+                with db_session.begin_nested():
+                    # Delete all existing sessions for this facility to ensure 100% accuracy
+                    # This prevents stale data and ensures we match the official source exactly
+                    deleted_count = db_session.execute(delete(Session).where(Session.facility_id == facility_id)).rowcount
+                    db_session.bulk_insert_mappings(Session, pending)
+                total_inserted += len(pending)
+                if deleted_count > 0:
+                    logger.info(f"  Deleted {deleted_count} existing sessions for {facility_name}")
+                
+                uncommitted += len(pending)
+                if uncommitted >= SESSION_COMMIT_ROWS:
+                    db_session.commit()
+                    uncommitted = 0
+                logger.success(f"✓ Processed {len(sessions)} sessions for {facility_name}")
+                
+            except Exception as e:
+                logger.error(f"Error processing {facility_name}: {e}")
+                continue
+    
+    db_session.commit()
     
     logger.info("=" * 60)
     logger.success(f"✓ Processed {total_sessions} sessions from JSON API")
@@ -384,6 +507,78 @@ def ingest_json_api_schedules(db_session):
     logger.info("=" * 60)
 
 
+# Facility pages are I/O-bound; fetch this many concurrently
+SCRAPE_WORKERS = 16
+
+
+def _scrape_facility_sessions(scraper, facility_id, website):
+    """
+    Scrape one facility page into session rows ready to insert.
+    
+    Runs in worker threads, so it must not touch the database session.
+    """
+    facility_data = scraper.scrape_facility_page(website)
+    if not facility_data or not facility_data.get('sessions'):
+        return []
+    
+    rows = []
+    for session_data in facility_data['sessions']:
+        # Parse time text into start/end times
+        time_text = session_data.get('time_text', '')
+        times = scraper.parse_time_text(time_text)
+        
+        if not times:
+            logger.debug("Could not parse time text: {}", time_text)
+            continue
+        
+        start_time, end_time = times
+        
+        # Get the session date
+        # New format: session_data has 'date' field with actual date object
+        # Old format: session_data has 'day' field with day name that needs conversion
+        session_date = session_data.get('date')
+        
+        if session_date:
+            # New format: we have the exact date
+            # Project this schedule forward for the next week only
+            # This ensures "Next Week" navigation works even if the source
+            # page only shows the current week
+            dates = []
+            for week_offset in range(2):  # Current week + next week
+                future_date = session_date + timedelta(weeks=week_offset)
+                dates.append(future_date)
+        else:
+            # Old format: convert day name to dates for the next 2 weeks
+            day_name = session_data.get('day', '')
+            dates = scraper.day_name_to_dates(day_name, weeks_ahead=2)
+            
+            if not dates:
+                logger.debug("Could not parse day name: {}", day_name)
+                continue
+        
+        swim_type = session_data.get('swim_type', 'OTHER')
+        
+        # Create a session for each date
+        for session_date in dates:
+            rows.append({
+                'facility_id': facility_id,
+                'swim_type': swim_type,
+                'date': session_date,
+                'start_time': start_time,
+                'end_time': end_time,
+                'source': 'web_scraper',
+                # Create session hash for deduplication
+                'hash': scraper.generate_session_hash(
+                    facility_id,
+                    str(session_date),
+                    str(start_time),
+                    swim_type
+                )
+            })
+    
+    return rows
+
+
 def ingest_schedules_legacy(db_session):
     """
     Legacy web scraper (DEPRECATED - use ingest_official_schedules instead).
@@ -391,108 +586,79 @@ def ingest_schedules_legacy(db_session):
     This scraper is kept as a fallback but should not be used in production.
     The official Toronto Open Data API provides more accurate and complete data.
     """
+    # Imported here so the default run never loads BeautifulSoup
+    from sources.facility_scraper import FacilityScraper
+    
     logger.warning("Using legacy web scraper (DEPRECATED)")
     logger.info("Ingesting swim schedules via web scraping")
     
-    # Get all facilities with websites
-    facilities = db_session.query(Facility).filter(
-        Facility.website.isnot(None),
-        Facility.is_indoor == True
+    # Get all facilities with websites (plain tuples, safe to hand to threads)
+    facilities = db_session.execute(
+        select(Facility.facility_id, Facility.name, Facility.website).where(
+            Facility.website.isnot(None),
+            Facility.is_indoor == True
+        )
     ).all()
     
-    scraper = FacilityScraper()
     total_sessions = 0
     total_inserted = 0
-    
-    for facility in facilities:
-        logger.info(f"Processing {facility.name}")
+    uncommitted = 0
+    
+    # Pages are fetched concurrently; all DB writes stay on this thread
+    with FacilityScraper() as scraper, ThreadPoolExecutor(max_workers=SCRAPE_WORKERS) as executor:
+        futures = {
+            executor.submit(_scrape_facility_sessions, scraper, facility.facility_id, facility.website): facility
+            for facility in facilities
+        }
         
-        try:
-            facility_data = scraper.scrape_facility_page(facility.website)
-            if facility_data and facility_data.get('sessions'):
-                sessions = facility_data['sessions']
+        for future in as_completed(futures):
+            facility = futures[future]
+            logger.info(f"Processing {facility.name}")
+            
+            try:
+                rows = future.result()
+                total_sessions += len(rows)
+                if not rows:
+                    continue
                 
-                for session_data in sessions:
-                    # Parse time text into start/end times
-                    time_text = session_data.get('time_text', '')
-                    times = FacilityScraper.parse_time_text(time_text)
-                    
-                    if not times:
-                        logger.debug(f"Could not parse time text: {time_text}")
-                        continue
-                    
-                    start_time, end_time = times
-                    
-                    # Get the session date
-                    # New format: session_data has 'date' field with actual date object
-                    # Old format: session_data has 'day' field with day name that needs conversion
-                    session_date = session_data.get('date')
-                    
-                    if session_date:
-                        # New format: we have the exact date
-                        # Project this schedule forward for the next week only
-                        # This ensures "Next Week" navigation works even if the source
-                        # page only shows the current week
-                        dates = []
-                        for week_offset in range(2):  # Current week + next week
-                            future_date = session_date + timedelta(weeks=week_offset)
-                            dates.append(future_date)
-                    else:
-                        # Old format: convert day name to dates for the next 2 weeks
-                        day_name = session_data.get('day', '')
-                        dates = FacilityScraper.day_name_to_dates(day_name, weeks_ahead=2)
-                        
-                        if not dates:
-                            logger.debug(f"Could not parse day name: {day_name}")
-                            continue
-                    
-                    swim_type = session_data.get('swim_type', 'OTHER')
+                # Write in a SAVEPOINT so a failure only discards this facility,
+                # not the uncommitted batch
+                with db_session.begin_nested():
+                    # One IN query per facility instead of a SELECT per session
+                    candidates = {row['hash']: row for row in rows}
+                    existing = set(db_session.execute(
+                        select(Session.hash).where(Session.hash.in_(list(candidates)))
+                    ).scalars())
+                    new_rows = [row for session_hash, row in candidates.items() if session_hash not in existing]
                     
-                    # Create a session for each date
-                    for session_date in dates:
-                        # Create session hash for deduplication
-                        session_hash = FacilityScraper.generate_session_hash(
-                            facility.facility_id,
-                            str(session_date),
-                            str(start_time),
-                            swim_type
-                        )
-                        
-                        # Check if exists
-                        existing = db_session.query(Session).filter_by(hash=session_hash).first()
-                        if not existing:
-                            # Insert new session
-                            new_session = Session(
-                                facility_id=facility.facility_id,
-                                swim_type=swim_type,
-                                date=session_date,
-                                start_time=start_time,
-                                end_time=end_time,
-                                source='web_scraper',
-                                hash=session_hash
-                            )
-                            db_session.add(new_session)
-                            total_inserted += 1
-                            logger.debug(
-                                f"Inserted session: {facility.name} - {swim_type} on {session_date} "
-                                f"from {start_time} to {end_time}"
-                            )
-                        
-                        total_sessions += 1
+                    db_session.bulk_insert_mappings(Session, new_rows)
+                    total_inserted += len(new_rows)
+                    logger.debug(f"Inserted {len(new_rows)} sessions for {facility.name}")
+                
+                uncommitted += len(new_rows)
+                if uncommitted >= SESSION_COMMIT_ROWS:
+                    db_session.commit()
+                    uncommitted = 0
             
-            # Commit after each facility to avoid losing all progress on error
-            db_session.commit()
-        
-        except Exception as e:
-            logger.error(f"Error processing {facility.name}: {e}")
-            db_session.rollback()
+            except Exception as e:
+                logger.error(f"Error processing {facility.name}: {e}")
+    
+    db_session.commit()
     
     logger.info(f"Processed {total_sessions} sessions, inserted {total_inserted} new sessions")
 
 
 def main():
     """Main entry point."""
-    setup_logging()
+    parser = argparse.ArgumentParser(description="Refresh pool facilities and schedules")
+    parser.add_argument(
+        "--debug-log",
+        action="store_true",
+        help="Also write a DEBUG-level log file under logs/"
+    )
+    args = parser.parse_args()
+    
+    setup_logging(debug_log=args.debug_log)
     logger.info("=" * 60)
     logger.info("Starting daily refresh job")
     logger.info("=" * 60)
@@ -14,11 +14,11 @@ from urllib.parse import quote
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from loguru import logger
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, update
 from sqlalchemy.orm import sessionmaker
 
 from config import settings
-from models import Base, Facility
+from models import Facility
 from sources.toronto_drop_in_api import TorontoDropInAPI
 
 
@@ -35,8 +35,8 @@ def setup_logging():
 def setup_database():
     """Set up database connection."""
     engine = create_engine(settings.database_url)
-    Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
+    # URL fixes are written with one bulk UPDATE, so nothing needs autoflush
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
     return SessionLocal()
 
 
@@ -56,53 +56,67 @@ def normalize_name(name: str) -> str:
     return name.strip()
 
 
-def match_facility(our_facility: Facility, toronto_locations: list) -> dict:
+def index_locations(toronto_locations: list) -> dict:
     """
-    Match our facility to Toronto Open Data location.
+    Resolve each Toronto location's name, postal code and address once.
     
-    Returns matched Toronto location dict or None.
+    Returns the lookups match_facility uses. Earlier locations win ties,
+    as they would in a linear scan.
     """
-    our_name = normalize_name(our_facility.name)
-    
-    # Try exact normalized name match first
+    by_name = {}
+    by_postal = {}
+    parsed = []
     for tl in toronto_locations:
         tl_name = normalize_name(
             tl.get('LocationName', '') or 
             tl.get('locationname', '') or 
             tl.get('Location Name', '')
         )
-        if our_name == tl_name:
-            logger.debug(f"Exact match: {our_facility.name} -> {tl.get('LocationName')}")
-            return tl
+        tl_postal = (
+            tl.get('PostalCode', '') or 
+            tl.get('postalcode', '') or 
+            tl.get('Postal Code', '')
+        ).replace(' ', '').upper()
+        tl_addr = (
+            tl.get('Address', '') or 
+            tl.get('address', '') or 
+            tl.get('StreetAddress', '')
+        ).lower()
+        
+        by_name.setdefault(tl_name, tl)
+        if tl_postal:
+            by_postal.setdefault(tl_postal, tl)
+        parsed.append((tl_name, tl_addr, tl))
+    
+    return {'by_name': by_name, 'by_postal': by_postal, 'parsed': parsed}
+
+
+def match_facility(our_facility: Facility, location_index: dict) -> dict:
+    """
+    Match our facility to Toronto Open Data location.
+    
+    Returns matched Toronto location dict or None.
+    """
+    our_name = normalize_name(our_facility.name)
+    
+    # Try exact normalized name match first
+    tl = location_index['by_name'].get(our_name)
+    if tl:
+        logger.debug(f"Exact match: {our_facility.name} -> {tl.get('LocationName')}")
+        return tl
     
     # Try postal code match
     if our_facility.postal_code:
         our_postal = our_facility.postal_code.replace(' ', '').upper()
-        for tl in toronto_locations:
-            tl_postal = (
-                tl.get('PostalCode', '') or 
-                tl.get('postalcode', '') or 
-                tl.get('Postal Code', '')
-            ).replace(' ', '').upper()
-            if tl_postal and our_postal == tl_postal:
-                logger.debug(f"Postal code match: {our_facility.name} -> {tl.get('LocationName')}")
-                return tl
+        tl = location_index['by_postal'].get(our_postal)
+        if tl:
+            logger.debug(f"Postal code match: {our_facility.name} -> {tl.get('LocationName')}")
+            return tl
     
     # Try partial name match with address verification
     if our_facility.address:
         our_addr_lower = our_facility.address.lower()
-        for tl in toronto_locations:
-            tl_name = normalize_name(
-                tl.get('LocationName', '') or 
-                tl.get('locationname', '') or 
-                tl.get('Location Name', '')
-            )
-            tl_addr = (
-                tl.get('Address', '') or 
-                tl.get('address', '') or 
-                tl.get('StreetAddress', '')
-            ).lower()
-            
+        for tl_name, tl_addr, tl in location_index['parsed']:
             # Check if names are similar and addresses match
             if (our_name in tl_name or tl_name in our_name) and tl_addr and tl_addr in our_addr_lower:
                 logger.debug(f"Partial match: {our_facility.name} -> {tl.get('LocationName')}")
@@ -153,6 +167,9 @@ def discover_and_update_urls(db_session, dry_run: bool = False):
     
     logger.info(f"Found {len(our_facilities)} facilities to process")
     
+    # Normalize every Toronto location once rather than once per facility
+    location_index = index_locations(toronto_locations)
+    
     updates = []
     no_match = []
     
@@ -161,7 +178,7 @@ def discover_and_update_urls(db_session, dry_run: bool = False):
         if facility.website and not facility.website.startswith('https://www.toronto.ca'):
             continue
         
-        matched = match_facility(facility, toronto_locations)
+        matched = match_facility(facility, location_index)
         
         if matched:
             # Get location ID (try various field names)
@@ -207,10 +224,11 @@ def discover_and_update_urls(db_session, dry_run: bool = False):
     
     if not dry_run and updates:
         logger.info("\nUpdating database...")
-        for update in updates:
-            facility = update['facility']
-            facility.website = update['new_url']
-        
+        # One executemany UPDATE keyed on the primary key
+        db_session.execute(update(Facility), [
+            {'facility_id': u['facility'].facility_id, 'website': u['new_url']}
+            for u in updates
+        ])
         db_session.commit()
         logger.success(f"✓ Updated {len(updates)} facility URLs in database")
     elif dry_run:
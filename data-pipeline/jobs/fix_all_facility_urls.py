@@ -9,19 +9,19 @@ This job:
 """
 import sys
 import csv
+import re
 from pathlib import Path
-from io import StringIO
 from typing import Dict, Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import requests
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, not_, or_, update
 from sqlalchemy.orm import sessionmaker
 from difflib import SequenceMatcher
 
 from config import settings
-from models import Base, Facility
+from models import Facility
 
 
 # Toronto Open Data CSV URL
@@ -32,50 +32,47 @@ TORONTO_FACILITIES_CSV_URL = (
     "parks-and-recreation-facilities-4326.csv"
 )
 
+# Minimum SequenceMatcher ratio accepted as a fuzzy name match
+FUZZY_MATCH_CUTOFF = 0.75
+
 
 def setup_database():
     """Set up database connection."""
     engine = create_engine(settings.database_url)
-    Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
+    # URL fixes are written with one bulk UPDATE, so nothing needs autoflush
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
     return SessionLocal()
 
 
-def normalize_name(name: str) -> str:
-    """Normalize facility name for matching."""
-    name = name.lower().strip()
-    # Remove common suffixes and prefixes
-    suffixes = [
-        ' arena and recreation centre',
-        ' community recreation centre',
-        ' community centre',
-        ' community center',
-        ' recreation centre',
-        ' recreation center',
-        ' neighbourhood services',
-        ' aquatic centre',
-        ' aquatic center',
-        ' aquatic complex',
-        ' district park pool',
-        ' community gardens',
-        ' clubhouse',
-        ' community pool',
-        ' and pool',
-        ' arena',
-        ' pool',
-    ]
-    
-    for suffix in suffixes:
-        if name.endswith(suffix):
-            name = name[:-len(suffix)]
-            break  # Only remove one suffix
-    
-    return name.strip()
+# Common suffixes stripped by normalize_name; longer forms come first
+NAME_SUFFIXES = (
+    ' arena and recreation centre',
+    ' community recreation centre',
+    ' community centre',
+    ' community center',
+    ' recreation centre',
+    ' recreation center',
+    ' neighbourhood services',
+    ' aquatic centre',
+    ' aquatic center',
+    ' aquatic complex',
+    ' district park pool',
+    ' community gardens',
+    ' clubhouse',
+    ' community pool',
+    ' and pool',
+    ' arena',
+    ' pool',
+)
 
+# At most one suffix is removed. The leftmost match at the end is the
+# longest, which is also the first in NAME_SUFFIXES order.
+_NAME_SUFFIX_RE = re.compile('(?:' + '|'.join(map(re.escape, NAME_SUFFIXES)) + r')\Z')
 
-def similarity_score(a: str, b: str) -> float:
-    """Calculate similarity score between two strings."""
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+
+def normalize_name(name: str) -> str:
+    """Normalize facility name for matching."""
+    return _NAME_SUFFIX_RE.sub('', name.lower().strip(), count=1).strip()
 
 
 def download_toronto_facilities() -> Dict[str, Dict]:
@@ -86,32 +83,32 @@ def download_toronto_facilities() -> Dict[str, Dict]:
     """
     print("Downloading Toronto Open Data facilities CSV...")
     
+    facilities = {}
     try:
-        response = requests.get(TORONTO_FACILITIES_CSV_URL, timeout=30)
-        response.raise_for_status()
+        # Parse rows as they arrive instead of buffering the whole CSV
+        with requests.get(TORONTO_FACILITIES_CSV_URL, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            response.encoding = response.encoding or 'utf-8'
+            reader = csv.DictReader(response.iter_lines(decode_unicode=True))
+            
+            for row in reader:
+                name = row['ASSET_NAME'].strip()
+                location_id = row['LOCATIONID']
+                url = row['URL']
+                
+                # Only include if it has a valid URL
+                if url and '/location/?id=' in url:
+                    normalized = normalize_name(name)
+                    if normalized:
+                        facilities[normalized] = {
+                            'name': name,
+                            'location_id': location_id,
+                            'url': url
+                        }
     except Exception as e:
         print(f"Error downloading facilities CSV: {e}")
         return {}
     
-    csv_data = StringIO(response.text)
-    reader = csv.DictReader(csv_data)
-    
-    facilities = {}
-    for row in reader:
-        name = row['ASSET_NAME'].strip()
-        location_id = row['LOCATIONID']
-        url = row['URL']
-        
-        # Only include if it has a valid URL
-        if url and '/location/?id=' in url:
-            normalized = normalize_name(name)
-            if normalized:
-                facilities[normalized] = {
-                    'name': name,
-                    'location_id': location_id,
-                    'url': url
-                }
-    
     print(f"Loaded {len(facilities)} facilities from Toronto Open Data")
     return facilities
 
@@ -128,20 +125,30 @@ def match_facility(our_facility: Facility, toronto_data: Dict) -> Optional[Dict]
     if our_name in toronto_data:
         return toronto_data[our_name]
     
-    # Try fuzzy matching
+    # Try fuzzy matching. Names are already lowercased by normalize_name.
     best_match = None
     best_score = 0.0
     best_key = None
     
+    # One matcher for all candidates; ratio() isn't symmetric, so our name
+    # stays the first sequence
+    matcher = SequenceMatcher()
+    matcher.set_seq1(our_name)
     for normalized_name, data in toronto_data.items():
-        score = similarity_score(our_name, normalized_name)
+        matcher.set_seq2(normalized_name)
+        # Cheap upper bounds first: skip names that can't be accepted or
+        # can't beat the current best (as difflib.get_close_matches does)
+        floor = max(best_score, FUZZY_MATCH_CUTOFF)
+        if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+            continue
+        score = matcher.ratio()
         if score > best_score:
             best_score = score
             best_match = data
             best_key = normalized_name
     
     # Accept match if similarity is high enough
-    if best_score >= 0.75:
+    if best_score >= FUZZY_MATCH_CUTOFF:
         if best_score < 0.90:  # Log uncertain matches
             print(f"  Fuzzy match ({best_score:.2f}): '{our_name}' -> '{best_key}'")
         return best_match
@@ -171,11 +178,9 @@ def fix_all_urls(db_session, dry_run: bool = False):
     # Get all Toronto facilities (exclude non-Toronto like YMCA, JCC, etc.)
     non_toronto_patterns = ['ymca', 'jcc', 'canlan', 'athletic club', 'pan am', 'variety village']
     
-    our_facilities = db_session.query(Facility).all()
-    toronto_only = [
-        f for f in our_facilities 
-        if not any(pattern in f.name.lower() for pattern in non_toronto_patterns)
-    ]
+    toronto_only = db_session.query(Facility).filter(
+        not_(or_(*(Facility.name.ilike(f'%{pattern}%') for pattern in non_toronto_patterns)))
+    ).all()
     
     print(f"Found {len(toronto_only)} Toronto facilities to process\n")
     
@@ -233,10 +238,11 @@ def fix_all_urls(db_session, dry_run: bool = False):
     
     if not dry_run and updates:
         print(f"\nUpdating {len(updates)} facilities in database...")
-        for update in updates:
-            facility = update['facility']
-            facility.website = update['new_url']
-        
+        # One executemany UPDATE keyed on the primary key
+        db_session.execute(update(Facility), [
+            {'facility_id': u['facility'].facility_id, 'website': u['new_url']}
+            for u in updates
+        ])
         db_session.commit()
         print(f"✓ Updated {len(updates)} facility URLs in database")
     elif dry_run:
@@ -11,7 +11,7 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from config import settings
-from models import Base, Facility
+from models import Facility
 
 
 def setup_logging():
@@ -27,7 +27,6 @@ def setup_logging():
 def setup_database():
     """Set up database connection."""
     engine = create_engine(settings.database_url)
-    Base.metadata.create_all(engine)
     SessionLocal = sessionmaker(bind=engine)
     return SessionLocal()
 
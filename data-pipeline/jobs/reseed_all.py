@@ -17,7 +17,7 @@ from sqlalchemy.orm import sessionmaker
 import hashlib
 
 from config import settings
-from models import Base, Facility, Session
+from models import Facility, Session
 from sources.toronto_pools_data import get_all_indoor_pools
 
 
@@ -75,7 +75,6 @@ def setup_logging():
 def setup_database():
     """Set up database connection."""
     engine = create_engine(settings.database_url)
-    Base.metadata.create_all(engine)
     SessionLocal = sessionmaker(bind=engine)
     return engine, SessionLocal()
 
@@ -83,7 +82,7 @@ def setup_database():
 def generate_session_hash(facility_id, session_date, start_time, swim_type):
     """Generate unique hash for session."""
     content = f"{facility_id}:{session_date}:{start_time}:{swim_type}"
-    return hashlib.sha256(content.encode()).hexdigest()
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
 
 
 def normalize_facility_id(name):
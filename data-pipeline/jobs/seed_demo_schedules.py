@@ -23,7 +23,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from config import settings
-from models import Base, Facility, Session
+from models import Facility, Session
 
 
 # Realistic swim times for different types
@@ -69,7 +69,6 @@ def setup_logging():
 def setup_database():
     """Set up database connection."""
     engine = create_engine(settings.database_url)
-    Base.metadata.create_all(engine)
     SessionLocal = sessionmaker(bind=engine)
     return engine, SessionLocal()
 
@@ -78,7 +77,7 @@ def generate_session_hash(facility_id, session_date, start_time, swim_type):
     """Generate unique hash for session."""
     import hashlib
     content = f"{facility_id}:{session_date}:{start_time}:{swim_type}"
-    return hashlib.sha256(content.encode()).hexdigest()
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
 
 
 def seed_demo_schedules(db_session):
@@ -12,7 +12,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from config import settings
-from models import Base, Facility
+from models import Facility
 from sources.toronto_pools_data import get_all_indoor_pools
 
 
@@ -29,7 +29,6 @@ def setup_logging():
 def setup_database():
     """Set up database connection."""
     engine = create_engine(settings.database_url)
-    Base.metadata.create_all(engine)
     SessionLocal = sessionmaker(bind=engine)
     return engine, SessionLocal()
 
@@ -28,7 +28,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from config import settings
-from models import Base, Facility
+from models import Facility
 
 
 # Toronto Open Data CSV URL
@@ -43,7 +43,6 @@ TORONTO_FACILITIES_CSV_URL = (
 def setup_database():
     """Set up database connection."""
     engine = create_engine(settings.database_url)
-    Base.metadata.create_all(engine)
     SessionLocal = sessionmaker(bind=engine)
     return SessionLocal()
 
@@ -1,8 +1,8 @@
 """Database models for pool data."""
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy import (
     Column, String, Boolean, DateTime, Date, Time, 
-    BigInteger, Double, Text, ForeignKey, UniqueConstraint
+    BigInteger, Double, Text, ForeignKey, Index, LargeBinary, UniqueConstraint, func
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
@@ -11,6 +11,11 @@ from sqlalchemy.orm import relationship
 Base = declarative_base()
 
 
+def utcnow() -> datetime:
+    """Timezone-aware current UTC time for column defaults."""
+    return datetime.now(timezone.utc)
+
+
 class Facility(Base):
     """Community pool facility."""
     
@@ -28,8 +33,9 @@ class Facility(Base):
     website = Column(Text)
     source = Column(String(50))
     raw = Column(JSONB)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Filled in by the database so bulk writes don't send timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     sessions = relationship("Session", back_populates="facility", cascade="all, delete-orphan")
@@ -51,15 +57,24 @@ class Session(Base):
     end_time = Column(Time, nullable=False)
     notes = Column(Text)
     source = Column(String(50))
-    hash = Column(String(64), unique=True)  # For deduplication
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    hash = Column(LargeBinary(16), unique=True)  # BLAKE2b-128 digest for deduplication
+    created_at = Column(DateTime(timezone=True), default=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
     
     # Relationships
     facility = relationship("Facility", back_populates="sessions")
     
     __table_args__ = (
         UniqueConstraint('facility_id', 'date', 'start_time', 'swim_type', name='uq_session'),
+        # Covers next-session lookups and per-facility counts without a heap fetch
+        Index(
+            'ix_sessions_facility_date_time', 'facility_id', 'date', 'start_time',
+            postgresql_include=['swim_type', 'end_time', 'notes']
+        ),
+        # Date-range schedule queries ordered by start time
+        Index('ix_sessions_date_start', 'date', 'start_time'),
+        # Swim type filters (e.g. LANE_SWIM) over a date range
+        Index('ix_sessions_swimtype_date', 'swim_type', 'date'),
     )
     
     def __repr__(self):
@@ -5,6 +5,8 @@ from datetime import datetime, timedelta, time as time_type, date as date_type
 from typing import List, Dict, Optional, Tuple
 from bs4 import BeautifulSoup
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from loguru import logger
 
 
@@ -17,13 +19,26 @@ class FacilityScraper:
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (compatible; SwimTO/1.0; +https://github.com/raolivei/swimTO)"
         })
+        # All facility pages live on toronto.ca, so keep pooled connections alive
+        # between pages and retry transient failures
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        ))
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.session.close()
     
     def scrape_facility_page(self, url: str) -> Optional[Dict]:
         """Scrape a single facility page."""
         try:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Extract facility info
             facility_data = {
@@ -429,8 +444,8 @@ class FacilityScraper:
         return dates
     
     @staticmethod
-    def generate_session_hash(facility_id: str, date: str, start_time: str, swim_type: str) -> str:
+    def generate_session_hash(facility_id: str, date: str, start_time: str, swim_type: str) -> bytes:
         """Generate unique hash for session deduplication."""
         content = f"{facility_id}:{date}:{start_time}:{swim_type}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        return hashlib.blake2b(content.encode(), digest_size=16).digest()
 
@@ -489,8 +489,8 @@ class TorontoDropInAPI:
         return None
     
     @staticmethod
-    def generate_session_hash(facility_id: str, session_date: date, start_time: time, swim_type: str) -> str:
+    def generate_session_hash(facility_id: str, session_date: date, start_time: time, swim_type: str) -> bytes:
         """Generate unique hash for session deduplication."""
         content = f"{facility_id}:{session_date}:{start_time}:{swim_type}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        return hashlib.blake2b(content.encode(), digest_size=16).digest()
 
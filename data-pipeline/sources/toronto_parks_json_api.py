@@ -6,6 +6,7 @@ These facilities have their schedules available at:
 https://www.toronto.ca/data/parks/live/locations/{location_id}/swim/week{1-4}.json
 """
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, date, time, timedelta
 from loguru import logger
@@ -21,6 +22,9 @@ class TorontoParksJSONAPI:
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (compatible; SwimTO/2.0; +https://github.com/raolivei/swimTO)"
         })
+        # Facility schedules are fetched from several threads at once; size
+        # the pool so each worker can keep its connection alive
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=32))
     
     def fetch_facility_schedule(
         self,